@@ -5,61 +5,138 @@ Creates cross-platform executables using PyInstaller
 
 Note: Icons are now supported with automatic format detection:
 - Windows: Uses .ico format (converted from PNG)
-- macOS: Uses .icns format (when available)
+- macOS: Uses .icns format (converted from PNG)
 - Linux: Uses .png format
-- Pillow is included for automatic conversion
+- Pillow is included for automatic conversion; converted icons are cached in
+  build/.icon-cache keyed on the PNG's content hash
 """
 
+import compileall
+import hashlib
+import importlib.metadata
+import multiprocessing
 import os
 import platform
 import shutil
+import stat
 import subprocess
 import sys
+import tarfile
+import tempfile
+import threading
+import time
+import zipfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
 
-class Builder:
-    def __init__(self):
-        self.project_root = Path(__file__).parent
-        self.dist_dir = self.project_root / "dist"
-        self.build_dir = self.project_root / "build"
-        self.spec_file = self.project_root / "integrations_finder.spec"
+def _kernel_copy(src, dst):
+    """Copy src to dst with copy_file_range, keeping the data inside the kernel"""
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            remaining = os.fstat(fsrc.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+    except OSError:
+        # e.g. copy_file_range not supported between these filesystems
+        return shutil.copy2(src, dst)
+    shutil.copystat(src, dst)
+    return dst
+
+
+# copy_file_range lets CoW filesystems (btrfs, XFS) share extents instead of copying bytes;
+# shutil.copy2 already uses sendfile on Linux, so it is the fallback everywhere else
+_copy_fallback = _kernel_copy if hasattr(os, "copy_file_range") else shutil.copy2
+
+
+def _fast_copy(src, dst):
+    """Hard link src to dst, falling back to a regular copy (e.g. across filesystems)"""
+    try:
+        os.link(src, dst)
+    except FileExistsError:
+        if os.path.samefile(src, dst):
+            return dst
+        _copy_fallback(src, dst)
+    except OSError:
+        _copy_fallback(src, dst)
+    return dst
+
+
+# Staging trees are throwaway copies of the PyInstaller output, so hard links are enough
+_copy_file = shutil.copy2 if sys.platform == "win32" else _fast_copy
+
+
+def _retry_remove(func, path, exc_info):
+    """rmtree error handler retrying files that are read-only or briefly held open (e.g. by antivirus)"""
+    for _ in range(5):
+        time.sleep(0.1)
+        try:
+            os.chmod(path, stat.S_IWRITE)
+            func(path)
+            return
+        except OSError:
+            pass
 
-    def get_platform_dist_dir(self, target_platform, target_arch):
-        """Get platform-specific dist directory"""
-        return self.dist_dir / target_platform / target_arch
 
-    def clean(self):
-        """Clean build artifacts"""
-        print("Cleaning build artifacts...")
-        if self.dist_dir.exists():
-            shutil.rmtree(self.dist_dir)
-        if self.build_dir.exists():
-            shutil.rmtree(self.build_dir)
-        if self.spec_file.exists():
-            self.spec_file.unlink()
-        print("Clean complete.")
+# rmtree's onerror is deprecated since Python 3.12 in favour of onexc; _retry_remove ignores
+# the error argument, so it serves as either
+_RMTREE_ERROR_HANDLER = {"onexc": _retry_remove} if sys.version_info >= (3, 12) else {"onerror": _retry_remove}
 
-    def create_spec_file(self, target_platform, target_arch):
-        """Create PyInstaller spec file for the target platform"""
-        print(f"Creating spec file for {target_platform}-{target_arch}...")
 
-        # Determine target architecture for PyInstaller
-        target_arch_value = "'arm64'" if target_arch == "aarch64" else "None"
+def _remove_tree(path):
+    """Move a directory out of the way and delete it in the background
 
-        # Determine icon path and executable name based on platform
-        icon_path = None
-        exe_name = "agent-integrations-finder"
+    The rename is instant, so the next build can recreate the directory right away. The
+    deleting thread isn't a daemon, so the interpreter waits for it before exiting.
+    """
+    trash = path.with_name(f".{path.name}.trash-{os.getpid()}-{time.time_ns()}")
+    try:
+        path.rename(trash)
+    except OSError:
+        # Renaming fails on Windows while something holds a file open; delete in place
+        shutil.rmtree(path, **_RMTREE_ERROR_HANDLER)
+        return
+    threading.Thread(target=shutil.rmtree, args=(trash,), kwargs=_RMTREE_ERROR_HANDLER).start()
+
+
+# Keep child processes from allocating a console window (and conhost.exe) on Windows
+_POPEN_FLAGS = subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0
+
+# Lines of PyInstaller output repeated when a build fails
+_FAILURE_TAIL_LINES = 40
+
+# PyInstaller work directories unused for this long are pruned from build/
+_WORK_DIR_MAX_AGE = 7 * 24 * 60 * 60
 
-        if target_platform == "win":
-            icon_path = "'assets/images/logo.ico'" if Path("assets/images/logo.ico").exists() else None
-            exe_name = "agent-integrations-finder.exe"
-        elif target_platform == "macos":
-            icon_path = "'assets/images/logo.icns'" if Path("assets/images/logo.icns").exists() else None
-        else:  # linux
-            icon_path = "'assets/images/logo.png'" if Path("assets/images/logo.png").exists() else None
 
-        spec_content = f"""# -*- mode: python ; coding: utf-8 -*-
+def _scan_files(directory, arc_prefix):
+    """Recursively yield (DirEntry, archive name) for the files below directory"""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            arcname = f"{arc_prefix}/{entry.name}"
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scan_files(entry.path, arcname)
+            elif not entry.is_dir():
+                # Like os.walk, symlinks to directories are neither followed nor archived
+                yield entry, arcname
+
+
+# Files that are already compressed are stored as-is in zip archives (a onefile .exe
+# carries its own compressed archive); native libraries are only deflated for release
+# builds, where size matters more than time
+_PRECOMPRESSED_SUFFIXES = {".zip", ".pyz", ".png", ".ico", ".exe"}
+_BINARY_SUFFIXES = {".pyd", ".dll", ".so"}
+
+
+class Builder:
+    # PyInstaller spec templates; only the executable name, icon, architecture and build mode vary per target.
+    # QtCore/QtGui/QtWidgets, requests and click are imported directly and found by the analysis;
+    # 'email' must not be excluded because http.client (and so requests) needs it
+    _SPEC_TEMPLATE = """# -*- mode: python ; coding: utf-8 -*-
 
 block_cipher = None
 
@@ -68,20 +145,33 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[
-        ('assets/images/logo.png', 'assets/images'),
+        ('assets/images/logo@60.png', 'assets/images'),
     ],
     hiddenimports=[
-        'PyQt6.QtCore',
-        'PyQt6.QtGui', 
-        'PyQt6.QtWidgets',
         'PyQt6.sip',
-        'requests',
-        'click',
     ],
     hookspath=[],
     hooksconfig={{}},
     runtime_hooks=[],
-    excludes=[],
+    excludes=[
+        'PyQt6.QtNetwork',
+        'PyQt6.QtDBus',
+        'PyQt6.QtQml',
+        'PyQt6.QtQuick',
+        'PyQt6.QtWebEngine',
+        'PyQt6.QtWebEngineCore',
+        'PyQt6.QtWebEngineWidgets',
+        'PyQt6.QtMultimedia',
+        'PyQt6.QtTest',
+        'PyQt6.QtSql',
+        'PyQt6.QtPrintSupport',
+        'tkinter',
+        'unittest',
+        'pydoc',
+        'xmlrpc',
+        'http.server',
+        'distutils',
+    ],
     win_no_prefer_redirects=False,
     win_private_assemblies=False,
     cipher=block_cipher,
@@ -90,7 +180,34 @@ a = Analysis(
 
 pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
 
-exe = EXE(
+{bundle_content}"""
+
+    # Windows ships a single onefile executable, so there is no _internal tree to collect and install
+    _ONEFILE_TEMPLATE = """exe = EXE(
+    pyz,
+    a.scripts,
+    a.binaries,
+    a.zipfiles,
+    a.datas,
+    [],
+    name='{exe_name}',
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip={strip},
+    upx={upx},
+    upx_exclude=[],
+    runtime_tmpdir=None,
+    console=True,
+    disable_windowed_traceback=False,
+    argv_emulation=False,
+    target_arch={target_arch_value},
+    codesign_identity=None,
+    entitlements_file=None,
+    icon={icon_path},
+)
+"""
+
+    _ONEDIR_TEMPLATE = """exe = EXE(
     pyz,
     a.scripts,
     [],
@@ -98,8 +215,8 @@ exe = EXE(
     name='{exe_name}',
     debug=False,
     bootloader_ignore_signals=False,
-    strip=False,
-    upx=True,
+    strip={strip},
+    upx={upx},
     console=True,
     disable_windowed_traceback=False,
     argv_emulation=False,
@@ -114,8 +231,8 @@ coll = COLLECT(
     a.binaries,
     a.zipfiles,
     a.datas,
-    strip=False,
-    upx=True,
+    strip={strip},
+    upx={upx},
     upx_exclude=[],
     name='agent-integrations-finder',
 )
@@ -137,45 +254,355 @@ if '{target_platform}' == 'macos':
     )
 """
 
-        with open(self.spec_file, "w") as f:
+    def __init__(
+        self,
+        fast_compress=False,
+        release_build=False,
+        fresh=False,
+        compress_threads=None,
+        use_upx=False,
+        backend="pyinstaller",
+    ):
+        self.fast_compress = fast_compress
+        self.release_build = release_build
+        self.fresh = fresh
+        self.use_upx = use_upx
+        self.backend = backend
+        # Threads available to parallel compressors; lowered when several targets package at once
+        self.compress_threads = compress_threads or os.cpu_count() or 1
+        self.project_root = Path(__file__).parent
+        self.dist_dir = self.project_root / "dist"
+        self.build_dir = self.project_root / "build"
+
+        # Probe the icon assets once; their availability doesn't change during a run
+        images_dir = self.project_root / "assets" / "images"
+        icon_candidates = {suffix: images_dir / f"logo{suffix}" for suffix in (".png", ".ico", ".icns")}
+        self._icons = {suffix: path for suffix, path in icon_candidates.items() if path.exists()}
+        self._resolved_icons = {}
+
+        # Per-target dist directories, and the ones already created during this run
+        self._dist_dirs = {}
+        self._created_dist_dirs = set()
+        # Bundles whose .py files were already byte-compiled during this run
+        self._precompiled_dirs = set()
+
+    def get_platform_dist_dir(self, target_platform, target_arch):
+        """Get platform-specific dist directory"""
+        key = (target_platform, target_arch)
+        if key not in self._dist_dirs:
+            self._dist_dirs[key] = self.dist_dir / target_platform / target_arch
+        return self._dist_dirs[key]
+
+    def _create_platform_dist_dir(self, target_platform, target_arch):
+        """Get platform-specific dist directory, creating it the first time it's needed"""
+        platform_dist_dir = self.get_platform_dist_dir(target_platform, target_arch)
+        if (target_platform, target_arch) not in self._created_dist_dirs:
+            platform_dist_dir.mkdir(parents=True, exist_ok=True)
+            self._created_dist_dirs.add((target_platform, target_arch))
+        return platform_dist_dir
+
+    def _spec_path(self, target_platform, target_arch):
+        """Get platform-specific spec file path"""
+        return self.project_root / f"integrations_finder.{target_platform}.{target_arch}.spec"
+
+    def _work_dir(self, target_platform, target_arch, spec_file):
+        """Get the PyInstaller work directory for a target, keyed on its spec and toolchain"""
+        return self.build_dir / f"{target_platform}-{target_arch}-{self._cache_key(spec_file)[:16]}"
+
+    def clean_all(self):
+        """Clean all build artifacts, including PyInstaller's work directory"""
+        print("Cleaning build artifacts...")
+        if self.dist_dir.exists():
+            _remove_tree(self.dist_dir)
+        self._created_dist_dirs.clear()
+        if self.build_dir.exists():
+            _remove_tree(self.build_dir)
+        # Per-target specs, plus the single spec file older versions of this script generated
+        spec_files = [*self.project_root.glob("integrations_finder.*.*.spec"), self.project_root / "integrations_finder.spec"]
+        for spec_file in spec_files:
+            if spec_file.exists():
+                spec_file.unlink()
+        print("Clean complete.")
+
+    def clean_dist_for(self, target_platform, target_arch):
+        """Clean the dist output of a single target, keeping the shared build cache"""
+        platform_dist_dir = self.get_platform_dist_dir(target_platform, target_arch)
+        if platform_dist_dir.exists():
+            print(f"Cleaning {platform_dist_dir}...")
+            _remove_tree(platform_dist_dir)
+        self._created_dist_dirs.discard((target_platform, target_arch))
+
+    def _ensure_icon(self, target_platform):
+        """Get the icon for the target platform, converting logo.png once per content hash"""
+        if target_platform not in self._resolved_icons:
+            self._resolved_icons[target_platform] = self._resolve_icon(target_platform)
+        return self._resolved_icons[target_platform]
+
+    def _resolve_icon(self, target_platform):
+        """Find or generate the icon for the target platform"""
+        png_path = self._icons.get(".png")
+
+        # Linux uses the PNG as-is
+        if target_platform not in ("win", "macos"):
+            return png_path
+
+        suffix = ".ico" if target_platform == "win" else ".icns"
+        fallback_icon = self._icons.get(suffix)
+        if png_path is None:
+            return fallback_icon
+
+        # The .ico is produced by convert_icon.py, so changes to it invalidate the cache too
+        digest = hashlib.sha256(png_path.read_bytes())
+        if suffix == ".ico":
+            digest.update((self.project_root / "convert_icon.py").read_bytes())
+        cached_icon = self.build_dir / ".icon-cache" / f"{digest.hexdigest()}{suffix}"
+        if cached_icon.exists():
+            return cached_icon
+
+        try:
+            from PIL import Image
+        except ImportError:
+            return fallback_icon
+
+        print(f"Converting {png_path} to {suffix} format...")
+        cached_icon.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary name first so an interrupted conversion never looks cached
+        temp_icon = cached_icon.with_name(f"{cached_icon.stem}.{os.getpid()}.tmp")
+        if suffix == ".ico":
+            from convert_icon import convert_png_to_ico
+
+            convert_png_to_ico(png_path, temp_icon)
+        else:
+            Image.open(png_path).save(temp_icon, format="ICNS")
+        os.replace(temp_icon, cached_icon)
+        return cached_icon
+
+    def create_spec_file(self, target_platform, target_arch):
+        """Create PyInstaller spec file for the target platform"""
+        print(f"Creating spec file for {target_platform}-{target_arch}...")
+
+        # Name the architecture explicitly on macOS so PyInstaller fails instead of silently
+        # building the host's architecture; target_arch is ignored on other platforms
+        if target_platform == "macos":
+            target_arch_value = "'arm64'" if target_arch == "aarch64" else "'x86_64'"
+        else:
+            target_arch_value = "None"
+
+        # Determine icon path and executable name based on platform
+        icon = self._ensure_icon(target_platform)
+        icon_path = f"'{icon.relative_to(self.project_root).as_posix()}'" if icon else None
+        exe_name = "agent-integrations-finder"
+
+        if target_platform == "win":
+            exe_name = "agent-integrations-finder.exe"
+
+        # Symbol stripping is slow, so only release builds use it (strip isn't meant for Windows).
+        # UPX is opt-in: it compresses every binary serially, slows down startup and trips antivirus
+        upx = self.use_upx
+        strip = self.release_build and target_platform != "win"
+
+        template = self._ONEFILE_TEMPLATE if target_platform == "win" else self._ONEDIR_TEMPLATE
+        values = {
+            "exe_name": exe_name,
+            "strip": strip,
+            "upx": upx,
+            "target_arch_value": target_arch_value,
+            "icon_path": icon_path,
+            "target_platform": target_platform,
+        }
+        spec_content = self._SPEC_TEMPLATE.format(bundle_content=template.format(**values))
+
+        # Record a digest of the generated content below the coding line so tooling can tell
+        # whether a spec on disk was edited or generated by an older build.py
+        coding_line, body = spec_content.split("\n", 1)
+        digest = hashlib.sha256(spec_content.encode()).hexdigest()
+        spec_content = f"{coding_line}\n# _spec digest: {digest}\n{body}"
+
+        spec_file = self._spec_path(target_platform, target_arch)
+
+        # Leave an unchanged spec untouched so PyInstaller keeps treating its cache as valid
+        if spec_file.exists() and spec_file.read_text() == spec_content:
+            print(f"Spec file up to date: {spec_file}")
+            return spec_file
+
+        with open(spec_file, "w") as f:
             f.write(spec_content)
 
-        print(f"Spec file created: {self.spec_file}")
+        print(f"Spec file created: {spec_file}")
+        return spec_file
+
+    def _cache_key(self, spec_file):
+        """Compute a key identifying the spec and toolchain a PyInstaller work directory belongs to"""
+        try:
+            pyinstaller_version = importlib.metadata.version("pyinstaller")
+        except importlib.metadata.PackageNotFoundError:
+            pyinstaller_version = "unknown"
+
+        digest = hashlib.sha256()
+        digest.update(spec_file.read_bytes())
+        digest.update(sys.version.encode())
+        digest.update(pyinstaller_version.encode())
+        return digest.hexdigest()
+
+    def _prune_work_dirs(self, target_platform, target_arch, current_dir):
+        """Remove this target's PyInstaller work directories that haven't been used for a while"""
+        cutoff = time.time() - _WORK_DIR_MAX_AGE
+        for work_dir in self.build_dir.glob(f"{target_platform}-{target_arch}-*"):
+            if work_dir != current_dir and work_dir.is_dir() and work_dir.stat().st_mtime < cutoff:
+                print(f"Removing stale PyInstaller cache: {work_dir}")
+                _remove_tree(work_dir)
 
     def build(self, target_platform, target_arch):
         """Build executable for target platform and architecture"""
         print(f"Building for {target_platform}-{target_arch}...")
 
+        if self.backend == "nuitka":
+            return self._build_nuitka(target_platform, target_arch)
+
         # Create spec file
-        self.create_spec_file(target_platform, target_arch)
+        spec_file = self.create_spec_file(target_platform, target_arch)
+
+        # Each target gets its own PyInstaller work directory so parallel builds don't share one.
+        # The name carries the spec/toolchain key, so switching back to an earlier configuration
+        # reuses its cache; touch it so pruning sees it as recently used
+        work_dir = self._work_dir(target_platform, target_arch, spec_file)
+        work_dir.mkdir(parents=True, exist_ok=True)
+        os.utime(work_dir)
+        self._prune_work_dirs(target_platform, target_arch, work_dir)
 
         # Get platform-specific dist directory
-        platform_dist_dir = self.get_platform_dist_dir(target_platform, target_arch)
-        platform_dist_dir.mkdir(parents=True, exist_ok=True)
+        platform_dist_dir = self._create_platform_dist_dir(target_platform, target_arch)
+
+        # A onefile build writes the executable straight into distpath, so point it at the
+        # same directory a COLLECT build would produce
+        dist_path = platform_dist_dir
+        if target_platform == "win":
+            dist_path = platform_dist_dir / "agent-integrations-finder"
 
         # Build command with platform-specific dist directory
         cmd = [
             sys.executable,
             "-m",
             "PyInstaller",
-            "--clean",
             "--noconfirm",
             "--distpath",
-            str(platform_dist_dir),
-            str(self.spec_file),
+            str(dist_path),
+            "--workpath",
+            str(work_dir),
+            str(spec_file),
         ]
+        # Reusing PyInstaller's cache is the default; --clean forces a full re-analysis
+        if self.fresh:
+            cmd.insert(3, "--clean")
 
+        if not self._run_logged(cmd, target_platform, target_arch):
+            return False
+
+        print("Build successful!")
+        return True
+
+    def _build_nuitka(self, target_platform, target_arch):
+        """Compile a onefile executable with Nuitka instead of bundling with PyInstaller"""
+        exe_name = "agent-integrations-finder.exe" if target_platform == "win" else "agent-integrations-finder"
+
+        # Nuitka compiles for the interpreter it runs on; only macOS can target another architecture
+        if target_platform != "macos" and not _host_can_build(target_platform, target_arch):
+            print(f"Nuitka can't build {target_platform}-{target_arch} on this host ({sys.platform} {platform.machine()})")
+            return False
+        if self.use_upx:
+            print("Warning: --upx is ignored with --backend=nuitka; the onefile payload is already compressed")
+
+        # Nuitka keeps its C sources and object files in the output directory, so leave them
+        # under build/ for the next run and only move the finished executable to dist/
+        work_dir = self.build_dir / f"nuitka-{target_platform}-{target_arch}"
+        if self.fresh and work_dir.exists():
+            _remove_tree(work_dir)
+        work_dir.mkdir(parents=True, exist_ok=True)
+
+        cmd = [
+            sys.executable,
+            "-m",
+            "nuitka",
+            "--onefile",
+            "--assume-yes-for-downloads",
+            "--enable-plugin=pyqt6",
+            f"--output-dir={work_dir}",
+            f"--output-filename={exe_name}",
+            f"--include-data-files={self.project_root / 'assets' / 'images' / 'logo@60.png'}=assets/images/logo@60.png",
+        ]
+        if target_platform == "macos":
+            cmd.append(f"--macos-target-arch={'arm64' if target_arch == 'aarch64' else 'x86_64'}")
+        icon = self._ensure_icon(target_platform)
+        if icon:
+            icon_option = {"win": "--windows-icon-from-ico", "macos": "--macos-app-icon"}.get(target_platform, "--linux-icon")
+            cmd.append(f"{icon_option}={icon}")
+        cmd.append(str(self.project_root / "integrations_finder.py"))
+
+        if not self._run_logged(cmd, target_platform, target_arch):
+            return False
+
+        # Match the layout of a PyInstaller build so packaging doesn't need to care
+        source_dir = self._create_platform_dist_dir(target_platform, target_arch) / "agent-integrations-finder"
+        source_dir.mkdir(exist_ok=True)
+        os.replace(work_dir / exe_name, source_dir / exe_name)
+
+        print("Build successful!")
+        return True
+
+    def _run_logged(self, cmd, target_platform, target_arch):
+        """Run a build command, returning True on success"""
         print(f"Running: {' '.join(cmd)}")
 
-        try:
-            result = subprocess.run(cmd, check=True, capture_output=True, text=True)
-            print("Build successful!")
-            return True
-        except subprocess.CalledProcessError as e:
-            print(f"Build failed: {e}")
-            print(f"stdout: {e.stdout}")
-            print(f"stderr: {e.stderr}")
+        # Stream the output line by line to the console and a per-target log
+        # instead of buffering all of it in memory until the build finishes
+        log_dir = self.project_root / "logs"
+        log_dir.mkdir(exist_ok=True)
+        log_file = log_dir / f"build-{target_platform}-{target_arch}.log"
+        prefix = f"[{target_platform}-{target_arch}] "
+
+        # Keep the tail of the output so a failure can be shown in one piece, even when
+        # parallel builds interleave their output on the console
+        tail = deque(maxlen=_FAILURE_TAIL_LINES)
+        with open(log_file, "w", encoding="utf-8") as log:
+            process = subprocess.Popen(
+                cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1, creationflags=_POPEN_FLAGS
+            )
+            for line in process.stdout:
+                log.write(line)
+                tail.append(line)
+                sys.stdout.write(prefix + line)
+            returncode = process.wait()
+
+        if returncode != 0:
+            print(f"Build failed with exit code {returncode}, last lines of {log_file}:")
+            sys.stdout.writelines(prefix + line for line in tail)
             return False
+        return True
+
+    def _staging_dir(self, prefix):
+        """Create a uniquely named staging directory that is removed once packaging is done"""
+        # Keep it under the project root so staged files can be hard linked from dist/
+        staging = tempfile.TemporaryDirectory(prefix=prefix, dir=self.project_root)
+        # The staging root becomes the package root, so give it regular directory permissions
+        os.chmod(staging.name, 0o755)
+        return staging
+
+    def _stage_unix_payload(self, source_dir, staging_root):
+        """Lay out the executable and its _internal directory under usr/local/bin in staging_root"""
+        self._precompile_pyc(source_dir)
+        bin_dir = staging_root / "usr" / "local" / "bin"
+        bin_dir.mkdir(parents=True)
+
+        # Copy the executable
+        executable = source_dir / "agent-integrations-finder"
+        if executable.exists():
+            _copy_file(executable, bin_dir / "agent-integrations-finder")
+            os.chmod(bin_dir / "agent-integrations-finder", 0o755)
+
+        # Copy _internal directory to /usr/local/bin (where PyInstaller expects it)
+        internal_dir = source_dir / "_internal"
+        if internal_dir.exists():
+            shutil.copytree(internal_dir, bin_dir / "_internal", copy_function=_copy_file)
 
     def create_deb_package(self, target_platform, target_arch, source_dir, output_dir):
         """Create .deb package for Debian/Ubuntu"""
@@ -191,10 +618,8 @@ if '{target_platform}' == 'macos':
         deb_path = output_dir / deb_name
 
         # Create temporary directory structure
-        temp_dir = self.project_root / "temp_deb"
-        if temp_dir.exists():
-            shutil.rmtree(temp_dir)
-        temp_dir.mkdir()
+        staging = self._staging_dir("temp_deb_")
+        temp_dir = Path(staging.name)
 
         # Create DEBIAN control file
         debian_dir = temp_dir / "DEBIAN"
@@ -213,34 +638,80 @@ Description: Agent Integrations Finder
         with open(debian_dir / "control", "w") as f:
             f.write(control_content)
 
-        # Create usr/local/bin directory and copy executable
-        bin_dir = temp_dir / "usr" / "local" / "bin"
-        bin_dir.mkdir(parents=True)
+        # Stage the executable and _internal directory
+        self._stage_unix_payload(source_dir, temp_dir)
 
-        # Copy the executable
-        executable = source_dir / "agent-integrations-finder"
-        if executable.exists():
-            shutil.copy2(executable, bin_dir / "agent-integrations-finder")
-            os.chmod(bin_dir / "agent-integrations-finder", 0o755)
+        # Create .deb package using dpkg-deb
+        try:
+            # Only release builds pay for maximum compression of the package payload
+            compression = ["-Zxz", "-z9"] if self.release_build else ["-Znone"]
+            cmd = ["dpkg-deb"] + compression + ["--build", str(temp_dir), str(deb_path)]
+            # Let dpkg-deb >= 1.21.9 use every core for threaded (xz) compression
+            env = os.environ.copy()
+            env.setdefault("DPKG_DEB_THREADS_MAX", str(self.compress_threads))
+            subprocess.run(cmd, check=True, env=env, creationflags=_POPEN_FLAGS)
+            print(f"Created .deb package: {deb_path}")
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            print("Warning: dpkg-deb not available, skipping .deb package creation")
+        finally:
+            # Clean up
+            staging.cleanup()
 
-        # Copy _internal directory to /usr/local/bin (where PyInstaller expects it)
-        bin_internal_dir = temp_dir / "usr" / "local" / "bin" / "_internal"
-        bin_internal_dir.mkdir(parents=True)
+    def create_fpm_packages(self, target_platform, target_arch, source_dir, output_dir):
+        """Create .deb and .rpm packages from a single staging tree using fpm"""
+        print("Creating .deb and .rpm packages with fpm...")
 
-        internal_dir = source_dir / "_internal"
-        if internal_dir.exists():
-            shutil.copytree(internal_dir, bin_internal_dir, dirs_exist_ok=True)
+        # Create package structure
+        package_name = "agent-integrations-finder"
+        package_version = "1.0.0"
+
+        # Convert architecture names to Debian format
+        deb_arch = target_arch.replace("x86_64", "amd64").replace("aarch64", "arm64")
+        deb_path = output_dir / f"{package_name}_{package_version}_{deb_arch}.deb"
+        rpm_path = output_dir / f"{package_name}-{package_version}-1.{target_arch}.rpm"
+
+        # Create temporary directory structure
+        staging = self._staging_dir("temp_staging_")
+        temp_dir = Path(staging.name)
+
+        # Stage the executable and _internal directory once for both package formats
+        self._stage_unix_payload(source_dir, temp_dir)
+
+        # Only release builds pay for compressing the package payload
+        compression = "xz" if self.release_build else "none"
+
+        common_args = [
+            "fpm",
+            "--force",
+            "-s",
+            "dir",
+            "-n",
+            package_name,
+            "-v",
+            package_version,
+            "--maintainer",
+            "SUSE Observability Team <observability@suse.com>",
+            "--description",
+            "A tool to trace from SUSE Observability Agent container tags to the corresponding integrations source code.",
+            "-C",
+            str(temp_dir),
+            "--prefix",
+            "/",
+        ]
 
-        # Create .deb package using dpkg-deb
         try:
-            cmd = ["dpkg-deb", "--build", str(temp_dir), str(deb_path)]
-            subprocess.run(cmd, check=True)
+            cmd = common_args + ["-t", "deb", "-a", deb_arch, "--deb-compression", compression, "-p", str(deb_path), "."]
+            subprocess.run(cmd, check=True, creationflags=_POPEN_FLAGS)
             print(f"Created .deb package: {deb_path}")
+
+            cmd = common_args + ["-t", "rpm", "-a", target_arch, "--rpm-compression", compression, "-p", str(rpm_path), "."]
+            subprocess.run(cmd, check=True, creationflags=_POPEN_FLAGS)
+            print(f"Created .rpm package: {rpm_path}")
         except (subprocess.CalledProcessError, FileNotFoundError):
-            print("Warning: dpkg-deb not available, skipping .deb package creation")
+            print("Warning: fpm failed, skipping .deb/.rpm package creation")
         finally:
             # Clean up
-            shutil.rmtree(temp_dir)
+            staging.cleanup()
 
     def create_msi_package(self, target_platform, target_arch, source_dir, output_dir):
         """Create .msi package for Windows"""
@@ -253,10 +724,8 @@ Description: Agent Integrations Finder
         msi_path = output_dir / msi_name
 
         # Create temporary directory structure
-        temp_dir = self.project_root / "temp_msi"
-        if temp_dir.exists():
-            shutil.rmtree(temp_dir)
-        temp_dir.mkdir()
+        staging = self._staging_dir("temp_msi_")
+        temp_dir = Path(staging.name)
 
         # Copy files to temp directory
         program_files = temp_dir / "Program Files" / package_name
@@ -265,12 +734,7 @@ Description: Agent Integrations Finder
         # Copy the executable
         executable = source_dir / "agent-integrations-finder.exe"
         if executable.exists():
-            shutil.copy2(executable, program_files / "agent-integrations-finder.exe")
-
-        # Copy _internal directory
-        internal_dir = source_dir / "_internal"
-        if internal_dir.exists():
-            shutil.copytree(internal_dir, program_files / "_internal")
+            _copy_file(executable, program_files / "agent-integrations-finder.exe")
 
         # Create WiX XML file for MSI
         wix_content = f"""<?xml version="1.0" encoding="UTF-8"?>
@@ -311,17 +775,17 @@ Description: Agent Integrations Finder
         # Try to build MSI using WiX
         try:
             cmd = ["candle", str(wix_file), "-out", str(temp_dir / f"{package_name}.wixobj")]
-            subprocess.run(cmd, check=True)
+            subprocess.run(cmd, check=True, creationflags=_POPEN_FLAGS)
 
             cmd = ["light", str(temp_dir / f"{package_name}.wixobj"), "-out", str(msi_path)]
-            subprocess.run(cmd, check=True)
+            subprocess.run(cmd, check=True, creationflags=_POPEN_FLAGS)
 
             print(f"Created .msi package: {msi_path}")
         except (subprocess.CalledProcessError, FileNotFoundError):
             print("Warning: WiX tools not available, skipping .msi package creation")
         finally:
             # Clean up
-            shutil.rmtree(temp_dir)
+            staging.cleanup()
 
     def create_pkg_package(self, target_platform, target_arch, source_dir, output_dir):
         """Create .pkg package for macOS"""
@@ -334,22 +798,22 @@ Description: Agent Integrations Finder
         pkg_path = output_dir / pkg_name
 
         # Create temporary directory structure
-        temp_dir = self.project_root / "temp_pkg"
-        if temp_dir.exists():
-            shutil.rmtree(temp_dir)
-        temp_dir.mkdir()
+        staging = self._staging_dir("temp_pkg_")
+        temp_dir = Path(staging.name)
 
         # Create package structure
         pkg_root = temp_dir / "pkgroot"
         pkg_root.mkdir()
 
+        self._precompile_pyc(source_dir)
+
         # Copy files to /usr/local/bin and /usr/local/lib
         bin_dir = pkg_root / "usr" / "local" / "bin"
         bin_dir.mkdir(parents=True)
 
         executable = source_dir / "agent-integrations-finder"
         if executable.exists():
-            shutil.copy2(executable, bin_dir / "agent-integrations-finder")
+            _copy_file(executable, bin_dir / "agent-integrations-finder")
             os.chmod(bin_dir / "agent-integrations-finder", 0o755)
 
         lib_dir = pkg_root / "usr" / "local" / "lib" / package_name
@@ -357,7 +821,7 @@ Description: Agent Integrations Finder
 
         internal_dir = source_dir / "_internal"
         if internal_dir.exists():
-            shutil.copytree(internal_dir, lib_dir / "_internal")
+            shutil.copytree(internal_dir, lib_dir / "_internal", copy_function=_copy_file)
 
         # Create package info
         info_dir = temp_dir / "package_info"
@@ -404,13 +868,68 @@ chmod +x /usr/local/bin/agent-integrations-finder
                 "/",
                 str(pkg_path),
             ]
-            subprocess.run(cmd, check=True)
+            subprocess.run(cmd, check=True, creationflags=_POPEN_FLAGS)
             print(f"Created .pkg package: {pkg_path}")
         except (subprocess.CalledProcessError, FileNotFoundError):
             print("Warning: pkgbuild not available, skipping .pkg package creation")
         finally:
             # Clean up
-            shutil.rmtree(temp_dir)
+            staging.cleanup()
+
+    def _gzip_command(self):
+        """Get a parallel gzip command if pigz is installed"""
+        if not shutil.which("pigz"):
+            return None
+        cmd = ["pigz", "-p", str(self.compress_threads)]
+        if self.fast_compress:
+            cmd.append("-1")
+        return cmd
+
+    def _create_tar_gz(self, archive_path, base_dir, dir_name):
+        """Create a .tar.gz archive of base_dir/dir_name"""
+        gzip_cmd = self._gzip_command()
+        if gzip_cmd:
+            # Pipe tar through pigz ourselves; GNU tar and bsdtar disagree on passing
+            # arguments to --use-compress-program
+            tar_cmd = ["tar", "-cf", "-", "-C", str(base_dir), dir_name]
+            with open(archive_path, "wb") as archive:
+                tar = subprocess.Popen(tar_cmd, stdout=subprocess.PIPE, creationflags=_POPEN_FLAGS)
+                gzip = subprocess.Popen(gzip_cmd, stdin=tar.stdout, stdout=archive, creationflags=_POPEN_FLAGS)
+                tar.stdout.close()
+                gzip_returncode = gzip.wait()
+                tar_returncode = tar.wait()
+            if tar_returncode:
+                raise subprocess.CalledProcessError(tar_returncode, tar_cmd)
+            if gzip_returncode:
+                raise subprocess.CalledProcessError(gzip_returncode, gzip_cmd)
+            return
+
+        if self.fast_compress:
+            # Trade a slightly larger archive for much less compression work
+            with tarfile.open(archive_path, "w:gz", compresslevel=1) as tar:
+                tar.add(base_dir / dir_name, arcname=dir_name)
+            return
+
+        cmd = ["tar", "-czf", str(archive_path), "-C", str(base_dir), dir_name]
+        subprocess.run(cmd, check=True, creationflags=_POPEN_FLAGS)
+
+    def _zip_compress_type(self, file_name, fast):
+        """Pick the zip compression for a file, storing data that barely compresses"""
+        suffix = Path(file_name).suffix.lower()
+        if suffix in _PRECOMPRESSED_SUFFIXES or (fast and suffix in _BINARY_SUFFIXES):
+            return zipfile.ZIP_STORED
+        return zipfile.ZIP_DEFLATED
+
+    def _precompile_pyc(self, source_dir):
+        """Byte-compile loose .py files in the bundle on all cores so end users don't pay for it on first run"""
+        # Every package format calls this, so only the first one in a run walks the bundle
+        if source_dir in self._precompiled_dirs:
+            return
+        self._precompiled_dirs.add(source_dir)
+        internal_dir = source_dir / "_internal"
+        if internal_dir.is_dir():
+            # The frozen interpreter runs without -O, so only the default optimization level gets used
+            compileall.compile_dir(str(internal_dir), workers=0, quiet=1)
 
     def package(self, target_platform, target_arch):
         """Package the built executable"""
@@ -425,13 +944,19 @@ chmod +x /usr/local/bin/agent-integrations-finder
             print(f"Error: Build directory not found: {source_dir}")
             return False
 
+        self._precompile_pyc(source_dir)
+
         # Create output directory
         output_dir = self.project_root / "packages"
         output_dir.mkdir(exist_ok=True)
 
         # Create system packages first
         if target_platform == "linux":
-            self.create_deb_package(target_platform, target_arch, source_dir, output_dir)
+            # fpm emits both .deb and .rpm from one staging tree; fall back to dpkg-deb without it
+            if shutil.which("fpm"):
+                self.create_fpm_packages(target_platform, target_arch, source_dir, output_dir)
+            else:
+                self.create_deb_package(target_platform, target_arch, source_dir, output_dir)
         elif target_platform == "win":
             self.create_msi_package(target_platform, target_arch, source_dir, output_dir)
         elif target_platform == "macos":
@@ -443,51 +968,92 @@ chmod +x /usr/local/bin/agent-integrations-finder
             archive_name = f"agent-integrations-finder-{target_platform}-{target_arch}.tar.gz"
             archive_path = output_dir / archive_name
 
-            cmd = [
-                "tar",
-                "-czf",
-                str(archive_path),
-                "-C",
-                str(platform_dist_dir),
-                dir_name,
-            ]
-            subprocess.run(cmd, check=True)
+            self._create_tar_gz(archive_path, platform_dist_dir, dir_name)
 
         elif target_platform == "macos":
             # Create .dmg or .tar.gz
             archive_name = f"agent-integrations-finder-{target_platform}-{target_arch}.tar.gz"
             archive_path = output_dir / archive_name
 
-            cmd = [
-                "tar",
-                "-czf",
-                str(archive_path),
-                "-C",
-                str(platform_dist_dir),
-                dir_name,
-            ]
-            subprocess.run(cmd, check=True)
+            self._create_tar_gz(archive_path, platform_dist_dir, dir_name)
 
         elif target_platform == "win":
             # Create zip using Python's zipfile module
             archive_name = f"agent-integrations-finder-{target_platform}-{target_arch}.zip"
             archive_path = output_dir / archive_name
 
-            import os
-            import zipfile
-
-            with zipfile.ZipFile(archive_path, "w", zipfile.ZIP_DEFLATED) as zipf:
-                source_dir = platform_dist_dir / dir_name
-                for root, dirs, files in os.walk(source_dir):
-                    for file in files:
-                        file_path = Path(root) / file
-                        arcname = file_path.relative_to(platform_dist_dir)
-                        zipf.write(file_path, arcname)
+            # Only release builds spend CPU on full compression
+            fast = self.fast_compress or not self.release_build
+            compresslevel = 1 if fast else None
+            with zipfile.ZipFile(
+                archive_path, "w", zipfile.ZIP_DEFLATED, compresslevel=compresslevel, allowZip64=True
+            ) as zipf:
+                for entry, arcname in _scan_files(source_dir, dir_name):
+                    compress_type = self._zip_compress_type(entry.name, fast)
+                    zipf.write(entry.path, arcname, compress_type=compress_type, compresslevel=compresslevel)
 
         print(f"Package created: {archive_path}")
         return True
 
-        pass
+
+def _host_can_build(platform_name, arch):
+    """Check whether this machine produces binaries for the given target"""
+    host_platform = {"linux": "linux", "darwin": "macos", "win32": "win"}.get(sys.platform)
+    host_arch = {"amd64": "x86_64", "x86_64": "x86_64", "arm64": "aarch64", "aarch64": "aarch64"}.get(
+        platform.machine().lower()
+    )
+    if platform_name == "docker":
+        platform_name = "linux"
+        arch = arch.replace("amd64", "x86_64").replace("arm64", "aarch64")
+    # Cross-architecture macOS builds need a universal2 Python and universal2 wheels for every
+    # dependency, which can't be assumed, so every platform only builds its own architecture
+    return platform_name == host_platform and arch == host_arch
+
+
+def _build_one(platform_name, arch, options):
+    """Build and package a single target, returning True on success"""
+    builder = Builder(
+        fast_compress=options["fast_compress"],
+        release_build=options["release_build"],
+        fresh=options["fresh"],
+        compress_threads=options["compress_threads"],
+        use_upx=options["use_upx"],
+        backend=options["backend"],
+    )
+
+    print(f"\n{'=' * 50}")
+    print(f"Building {platform_name}-{arch}")
+    print(f"{'=' * 50}")
+
+    if platform_name == "docker":
+        # Handle Docker builds
+        print(f"Building Docker image for {arch}...")
+        linux_arch = arch.replace("amd64", "x86_64").replace("arm64", "aarch64")
+        builder.clean_dist_for("linux", linux_arch)
+        if builder.build("linux", linux_arch):
+            print(f"Docker build preparation completed for {arch}")
+            return True
+        print(f"Failed to prepare Docker build for {arch}")
+        return False
+
+    builder.clean_dist_for(platform_name, arch)
+    if not builder.build(platform_name, arch):
+        print(f"Failed to build {platform_name}-{arch}")
+        return False
+
+    # Handle package-only options
+    source_dir = builder.get_platform_dist_dir(platform_name, arch) / "agent-integrations-finder"
+    output_dir = builder.project_root / "packages"
+    if options["create_deb_only"] and platform_name == "linux":
+        builder.create_deb_package(platform_name, arch, source_dir, output_dir)
+    elif options["create_msi_only"] and platform_name == "win":
+        builder.create_msi_package(platform_name, arch, source_dir, output_dir)
+    elif options["create_pkg_only"] and platform_name == "macos":
+        builder.create_pkg_package(platform_name, arch, source_dir, output_dir)
+    else:
+        # Normal packaging (all formats)
+        builder.package(platform_name, arch)
+    return True
 
 
 def main():
@@ -500,19 +1066,28 @@ def main():
         print("  macos-x86_64")
         print("  macos-aarch64")
         print("  win-x86_64")
-        print("  all")
+        print("  all              (every target this host can build)")
         print("  docker-amd64")
         print("  docker-arm64")
         print("  docker-all")
+        print("  clean")
         print("")
         print("Options:")
         print("  --create-deb-only    - Create only .deb package (Linux)")
         print("  --create-msi-only    - Create only .msi package (Windows)")
         print("  --create-pkg-only    - Create only .pkg package (macOS)")
+        print("  --force-clean        - Remove previous build artifacts before building")
+        print("  --fresh              - Rerun PyInstaller's full analysis instead of reusing its cache")
+        print("  --fast-compress      - Use the fastest compression level for archives")
+        print("  --release            - Fully compress system packages (default: uncompressed)")
+        print("  --upx                - Compress the bundled binaries with UPX")
+        print("  --backend=nuitka     - Compile a onefile executable with Nuitka instead of PyInstaller")
+        print("  --jobs N             - Build at most N targets in parallel (default: CPU count)")
         print("")
         print("Examples:")
         print("  python build.py linux-x86_64")
         print("  python build.py linux-x86_64 --create-deb-only")
+        print("  python build.py linux-x86_64 --force-clean")
         print("  python build.py docker-all")
         print("  python build.py all")
         sys.exit(1)
@@ -520,10 +1095,38 @@ def main():
     target = sys.argv[1]
     builder = Builder()
 
+    if target == "clean":
+        builder.clean_all()
+        return
+
     # Check for package-only options
     create_deb_only = "--create-deb-only" in sys.argv
     create_msi_only = "--create-msi-only" in sys.argv
     create_pkg_only = "--create-pkg-only" in sys.argv
+    force_clean = "--force-clean" in sys.argv
+    fast_compress = "--fast-compress" in sys.argv
+    release_build = "--release" in sys.argv
+    fresh = "--fresh" in sys.argv
+    use_upx = "--upx" in sys.argv
+
+    backend = "pyinstaller"
+    for arg in sys.argv[2:]:
+        if arg.startswith("--backend="):
+            backend = arg.split("=", 1)[1]
+    if backend not in ("pyinstaller", "nuitka"):
+        print(f"Unknown backend: {backend}")
+        sys.exit(1)
+
+    jobs = os.cpu_count() or 1
+    if "--jobs" in sys.argv:
+        try:
+            jobs = int(sys.argv[sys.argv.index("--jobs") + 1])
+        except (IndexError, ValueError):
+            print("Error: --jobs requires a number")
+            sys.exit(1)
+        if jobs < 1:
+            print("Error: --jobs must be at least 1")
+            sys.exit(1)
 
     targets = {
         "linux-x86_64": ("linux", "x86_64"),
@@ -536,7 +1139,14 @@ def main():
     }
 
     if target == "all":
-        build_targets = targets.values()
+        # PyInstaller bundles the interpreter it runs on, so every other target would just repeat
+        # the same analysis and produce host binaries under the wrong name
+        build_targets = [
+            (platform_name, arch) for platform_name, arch in targets.values() if _host_can_build(platform_name, arch)
+        ]
+        if not build_targets:
+            print(f"No targets can be built on this host ({sys.platform} {platform.machine()})")
+            sys.exit(1)
     elif target == "docker-all":
         build_targets = [("docker", "amd64"), ("docker", "arm64")]
     elif target in targets:
@@ -545,53 +1155,41 @@ def main():
         print(f"Unknown target: {target}")
         sys.exit(1)
 
-    # Clean first
-    builder.clean()
-
-    # Build each target
-    for platform_name, arch in build_targets:
-        print(f"\n{'=' * 50}")
-        print(f"Building {platform_name}-{arch}")
-        print(f"{'=' * 50}")
-
-        if platform_name == "docker":
-            # Handle Docker builds
-            print(f"Building Docker image for {arch}...")
-            if builder.build("linux", arch.replace("amd64", "x86_64").replace("arm64", "aarch64")):
-                print(f"Docker build preparation completed for {arch}")
-            else:
-                print(f"Failed to prepare Docker build for {arch}")
+    # Keep PyInstaller's work directory between runs so rebuilds are incremental
+    if force_clean:
+        builder.clean_all()
+
+    # Docker targets only prepare the matching Linux executable, so drop them when that
+    # Linux target is built anyway; otherwise both would write the same dist directory
+    linux_archs = {arch for platform_name, arch in build_targets if platform_name == "linux"}
+    build_targets = [
+        (platform_name, arch)
+        for platform_name, arch in build_targets
+        if not (platform_name == "docker" and arch.replace("amd64", "x86_64").replace("arm64", "aarch64") in linux_archs)
+    ]
+
+    # Build each target in its own process; the PyInstaller runs are independent
+    options = {
+        "create_deb_only": create_deb_only,
+        "create_msi_only": create_msi_only,
+        "create_pkg_only": create_pkg_only,
+        "fast_compress": fast_compress,
+        "release_build": release_build,
+        "fresh": fresh,
+        "use_upx": use_upx,
+        "backend": backend,
+    }
+    max_workers = min(len(build_targets), jobs)
+    # Split the cores between the targets so their compressors don't oversubscribe the machine
+    options["compress_threads"] = max(1, (os.cpu_count() or 1) // max_workers)
+    # Spawn the workers rather than forking: clean_all may have left a deletion thread running,
+    # and forking a process with live threads isn't safe
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")) as executor:
+        futures = [executor.submit(_build_one, platform_name, arch, options) for platform_name, arch in build_targets]
+        for future in as_completed(futures):
+            if not future.result():
+                executor.shutdown(wait=False, cancel_futures=True)
                 sys.exit(1)
-        elif builder.build(platform_name, arch):
-            # Handle package-only options
-            if create_deb_only and platform_name == "linux":
-                builder.create_deb_package(
-                    platform_name,
-                    arch,
-                    builder.get_platform_dist_dir(platform_name, arch) / "agent-integrations-finder",
-                    builder.project_root / "packages",
-                )
-
-            elif create_msi_only and platform_name == "win":
-                builder.create_msi_package(
-                    platform_name,
-                    arch,
-                    builder.get_platform_dist_dir(platform_name, arch) / "agent-integrations-finder",
-                    builder.project_root / "packages",
-                )
-            elif create_pkg_only and platform_name == "macos":
-                builder.create_pkg_package(
-                    platform_name,
-                    arch,
-                    builder.get_platform_dist_dir(platform_name, arch) / "agent-integrations-finder",
-                    builder.project_root / "packages",
-                )
-            else:
-                # Normal packaging (all formats)
-                builder.package(platform_name, arch)
-        else:
-            print(f"Failed to build {platform_name}-{arch}")
-            sys.exit(1)
 
     print("\nAll builds completed successfully!")
 
@@ -4,7 +4,10 @@ Utility script to convert PNG logo to ICO format for Windows builds.
 Requires Pillow to be installed.
 """
 
+import functools
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 try:
@@ -14,6 +17,14 @@ except ImportError:
     sys.exit(1)
 
 
+@functools.lru_cache(maxsize=4)
+def _load_png(path, mtime):
+    """Decode a PNG once; mtime is part of the cache key so an edited file is decoded again"""
+    img = Image.open(path).convert("RGBA")
+    img.load()
+    return img
+
+
 def convert_png_to_ico(png_path, ico_path, sizes=None):
     """
     Convert PNG image to ICO format with multiple sizes.
@@ -27,17 +38,34 @@ def convert_png_to_ico(png_path, ico_path, sizes=None):
         sizes = [16, 32, 48, 64, 128, 256]
 
     try:
-        # Open the PNG image
-        img = Image.open(png_path)
+        # Open the PNG image, fully decoded so the resize threads don't trigger lazy loading
+        img = _load_png(str(png_path), os.path.getmtime(png_path))
+
+        width, height = img.size
+
+        def resize(size):
+            # A square source already at this size needs no filtering, and upscaling gains
+            # nothing from LANCZOS, so only downscales pay for it
+            if (width, height) == (size, size):
+                return img
+            if size >= width:
+                return img.resize((size, size), Image.Resampling.NEAREST)
+            return img.resize((size, size), Image.Resampling.LANCZOS)
 
-        # Create list of resized images
-        images = []
-        for size in sizes:
-            resized_img = img.resize((size, size), Image.Resampling.LANCZOS)
-            images.append(resized_img)
+        # Create list of resized images; Pillow releases the GIL while resampling, and
+        # map() keeps them in the same order as sizes
+        with ThreadPoolExecutor(max_workers=min(len(sizes), os.cpu_count() or 1)) as executor:
+            images = list(executor.map(resize, sizes))
 
         # Save as ICO
-        images[0].save(ico_path, format="ICO", sizes=[(size, size) for size in sizes], append_images=images[1:])
+        # Pillow drops ICO sizes larger than the image being saved, so save from the largest one
+        largest = max(range(len(sizes)), key=lambda i: sizes[i])
+        images[largest].save(
+            ico_path,
+            format="ICO",
+            sizes=[(size, size) for size in sizes],
+            append_images=images[:largest] + images[largest + 1 :],
+        )
 
         print(f"✅ Successfully converted {png_path} to {ico_path}")
         print(f"   Sizes: {sizes}")
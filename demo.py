@@ -46,10 +46,10 @@ def demo_workflow():
     print()
 
     finder = IntegrationsFinder()
-    success, message = finder.find_integrations(test_input)
+    result = finder.find_integrations(test_input)
 
     print("Actual result:")
-    print(message)
+    print(result.message)
     print()
 
 
@@ -6,35 +6,93 @@ A tool to trace from SUSE Observability Agent container tags to the correspondin
 """
 
 import json
+import os
 import re
+import sqlite3
 import sys
+import threading
+import time
 import webbrowser
-from typing import Optional, Tuple
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Optional, Set, Tuple
 
 import click
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-# Import PyQt6 only when needed for GUI functionality
+# orjson parses GitHub responses faster; the stdlib parser is used when it isn't installed
 try:
-    from PyQt6.QtCore import Qt, QThread, QUrl, pyqtSignal
-    from PyQt6.QtGui import QDesktopServices, QFont, QPixmap
-    from PyQt6.QtWidgets import (
-        QApplication,
-        QHBoxLayout,
-        QLabel,
-        QLineEdit,
-        QMainWindow,
-        QMessageBox,
-        QProgressBar,
-        QPushButton,
-        QTextEdit,
-        QVBoxLayout,
-        QWidget,
-    )
-
-    PYQT6_AVAILABLE = True
+    import orjson
+
+    _json_loads = orjson.loads
 except ImportError:
-    PYQT6_AVAILABLE = False
+    _json_loads = json.loads
+
+# Patterns used to pick a git SHA out of tags and image references, compiled once
+# 8-character hex strings (git short SHA)
+_SHA_RE = re.compile(r"[a-fA-F0-9]{8}")
+# SHA following a container tag version (e.g., 7.51.1-a1b2c3d4) or else the quay.io image
+# (e.g., quay.io/stackstate/stackstate-k8s-agent:a1b2c3d4), in one match call; the first
+# alternative is tried across the whole input before the second, so a container tag wins
+# wherever it appears
+_TAGGED_SHA_RE = re.compile(
+    r"(?s).*?[0-9]+\.[0-9]+\.[0-9]+-([a-fA-F0-9]{8})|.*?quay\.io/stackstate/stackstate-k8s-agent:([a-fA-F0-9]{8})"
+)
+# Version names shaped like a release tag (7.51.1, 7.51.1-3, v1.0.0); anything else is a branch
+_TAG_LIKE_RE = re.compile(r"v?\d+\.\d+\.\d+(?:[-.]\w+)*")
+# GraphQL queries resolving each step of a search in one request; commits are selected
+# by expression because the input is an abbreviated SHA
+_COMMIT_FIELDS = "oid url author { name date }"
+_AGENT_QUERY = f"""
+query($sha: String!, $depsFile: String!) {{
+  repository(owner: "StackVista", name: "stackstate-agent") {{
+    commit: object(expression: $sha) {{ ... on Commit {{ {_COMMIT_FIELDS} }} }}
+    deps: object(expression: $depsFile) {{ ... on Blob {{ text }} }}
+  }}
+}}
+"""
+_INTEGRATIONS_QUERY = f"""
+query($version: String!, $tagRef: String!) {{
+  repository(owner: "StackVista", name: "stackstate-agent-integrations") {{
+    tag: ref(qualifiedName: $tagRef) {{ name }}
+    commit: object(expression: $version) {{
+      ... on Commit {{ {_COMMIT_FIELDS} }}
+      ... on Tag {{ target {{ ... on Commit {{ {_COMMIT_FIELDS} }} }} }}
+    }}
+  }}
+}}
+"""
+# Resolved searches are kept in integrations-finder/cache.sqlite under the user cache
+# directory; a search result never changes once the integrations version is a released tag
+_CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sha_resolve(
+    sha TEXT PRIMARY KEY,
+    integrations_version TEXT,
+    agent_commit_json TEXT,
+    integrations_commit_json TEXT,
+    is_branch INT,
+    ts REAL
+)
+"""
+
+
+def _json(response: requests.Response):
+    """Parse the JSON body of a response."""
+    return _json_loads(response.content)
+
+
+@dataclass
+class FinderResult:
+    """Outcome of a search; message is the human-readable report."""
+
+    success: bool
+    message: str
+    is_branch: bool = False
+    integrations_url: Optional[str] = None
 
 
 class IntegrationsFinder:
@@ -42,10 +100,98 @@ class IntegrationsFinder:
 
     AGENT_REPO = "https://github.com/StackVista/stackstate-agent"
     INTEGRATIONS_REPO = "https://github.com/StackVista/stackstate-agent-integrations"
+    GRAPHQL_URL = "https://api.github.com/graphql"
+    # How long the integrations tag list is reused before fetching it again (seconds)
+    TAGS_CACHE_TTL = 300
+    # How many GitHub responses are kept for ETag revalidation
+    ETAG_CACHE_SIZE = 256
 
-    def __init__(self):
+    def __init__(self, use_cache: bool = True):
         self.session = requests.Session()
         self.session.headers.update({"User-Agent": "SUSE-Observability-Integrations-Finder/1.0"})
+        # Keep a warm connection pool per GitHub host and retry transient gateway errors
+        # on the same connection instead of failing the whole lookup
+        retry = Retry(total=3, connect=1, backoff_factor=0.3, status_forcelist=[502, 503, 504], raise_on_status=False)
+        for host in ("https://api.github.com", "https://raw.githubusercontent.com"):
+            self.session.mount(host, HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry))
+        # (fetch time, tag names seen so far, next page URL and params) of the integrations tag list
+        self._tags_cache: Optional[Tuple[float, Set[str], Optional[Tuple[str, Optional[dict]]]]] = None
+        # URL and params -> (ETag, parsed value) for conditional GitHub requests, least recently
+        # used first; the lookup threads share it
+        self._etag_cache: "OrderedDict[str, Tuple[str, Any]]" = OrderedDict()
+        self._etag_lock = threading.Lock()
+        # An authenticated session gets 5000 API requests per hour instead of 60 and enables
+        # the GraphQL lookups, which need authentication
+        self._token = os.environ.get("GITHUB_TOKEN") or os.environ.get("GH_TOKEN")
+        if self._token:
+            self.session.headers["Authorization"] = f"Bearer {self._token}"
+            self.session.headers["X-GitHub-Api-Version"] = "2022-11-28"
+        self._rate_limit_warned = False
+        self.session.hooks["response"].append(self._check_rate_limit)
+        # Whether resolved searches are read from and stored in the on-disk cache
+        self.use_cache = use_cache
+        # Runs the independent GitHub lookups of a search concurrently; kept for the finder's
+        # lifetime so repeated searches don't start new threads
+        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="integrations-finder")
+
+    def _check_rate_limit(self, response: requests.Response, *args, **kwargs):
+        """Warn once when the GitHub API rate limit is nearly used up."""
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        if remaining is None or self._rate_limit_warned or not remaining.isdigit() or int(remaining) >= 10:
+            return
+        self._rate_limit_warned = True
+        print(f"Warning: only {remaining} GitHub API requests left in the current rate limit window.")
+        if not self._token:
+            print("Set GITHUB_TOKEN or GH_TOKEN to raise the limit from 60 to 5000 requests per hour.")
+
+    def _cached_get(
+        self,
+        url: str,
+        parse: Callable[[requests.Response], Any],
+        params: Optional[dict] = None,
+        headers: Optional[dict] = None,
+    ) -> Tuple[int, Any]:
+        """
+        GET a URL, revalidating a previously fetched response with its ETag.
+
+        GitHub answers an unchanged resource with an empty 304, which doesn't count against
+        the rate limit; the value parsed from the earlier response is reused in that case.
+        Only the parsed value is kept, for the ETAG_CACHE_SIZE most recently used URLs.
+
+        Args:
+            url: URL to fetch
+            parse: Turns a 200 response into the value the caller needs
+            params: Optional query parameters
+            headers: Optional request headers
+
+        Returns:
+            Tuple of (status code, parsed value or None if the status isn't 200)
+        """
+        key = url + "?" + "&".join(f"{k}={v}" for k, v in sorted((params or {}).items()))
+        with self._etag_lock:
+            cached = self._etag_cache.get(key)
+        headers = dict(headers or {})
+        if cached:
+            headers["If-None-Match"] = cached[0]
+
+        response = self.session.get(url, params=params, headers=headers)
+        if response.status_code == 304 and cached:
+            with self._etag_lock:
+                if key in self._etag_cache:
+                    self._etag_cache.move_to_end(key)
+            return 200, cached[1]
+        if response.status_code != 200:
+            return response.status_code, None
+
+        value = parse(response)
+        etag = response.headers.get("ETag")
+        if etag:
+            with self._etag_lock:
+                self._etag_cache[key] = (etag, value)
+                self._etag_cache.move_to_end(key)
+                while len(self._etag_cache) > self.ETAG_CACHE_SIZE:
+                    self._etag_cache.popitem(last=False)
+        return 200, value
 
     def extract_sha(self, input_string: str) -> Optional[str]:
         """
@@ -57,32 +203,47 @@ class IntegrationsFinder:
         Returns:
             8-character SHA if found, None otherwise
         """
-        # Pattern to match 8-character hex strings (git short SHA)
-        sha_pattern = r"[a-fA-F0-9]{8}"
-
-        # If input is already 8 characters and looks like a SHA, return it
-        if len(input_string) == 8 and re.match(sha_pattern, input_string):
+        # If input is already an 8-character SHA, return it
+        if _SHA_RE.fullmatch(input_string):
             return input_string
 
-        # Look for SHA in container tag format (e.g., 7.51.1-a1b2c3d4 or quay.io/stackstate/stackstate-k8s-agent:a1b2c3d4)
-        container_pattern = r"[0-9]+\.[0-9]+\.[0-9]+-([a-fA-F0-9]{8})"
-        match = re.search(container_pattern, input_string)
+        # Look for SHA in container tag format (e.g., 7.51.1-a1b2c3d4) or quay.io format
+        # (e.g., quay.io/stackstate/stackstate-k8s-agent:a1b2c3d4)
+        match = _TAGGED_SHA_RE.match(input_string)
         if match:
-            return match.group(1)
-
-        # Look for SHA in quay.io format (e.g., quay.io/stackstate/stackstate-k8s-agent:a1b2c3d4)
-        quay_pattern = r"quay\.io/stackstate/stackstate-k8s-agent:([a-fA-F0-9]{8})"
-        match = re.search(quay_pattern, input_string)
-        if match:
-            return match.group(1)
+            return match.group(match.lastindex)
 
         # Look for any 8-character hex string in the input
-        match = re.search(sha_pattern, input_string)
+        match = _SHA_RE.search(input_string)
         if match:
             return match.group(0)
 
         return None
 
+    @staticmethod
+    def _slim_commit(commit: dict) -> dict:
+        """
+        Keep only the commit fields a search reports.
+
+        A REST commit carries its changed files, stats and parents; dropping them keeps the
+        dicts held by a search and written to the result cache small.
+        """
+        author = (commit.get("commit") or {}).get("author")
+        return {
+            "sha": commit.get("sha"),
+            "html_url": commit.get("html_url"),
+            "commit": {"author": {"name": author.get("name"), "date": author.get("date")} if author else None},
+        }
+
+    def _parse_commit(self, response: requests.Response) -> dict:
+        """Parse a REST commit response down to the reported fields."""
+        return self._slim_commit(_json(response))
+
+    @staticmethod
+    def _parse_deps(response: requests.Response) -> Optional[str]:
+        """Parse the integrations version out of a stackstate-deps.json response."""
+        return _json(response).get("STACKSTATE_INTEGRATIONS_VERSION")
+
     def get_agent_commit(self, sha: str) -> Optional[dict]:
         """
         Fetch agent commit information from GitHub.
@@ -94,21 +255,13 @@ class IntegrationsFinder:
             Commit information dict or None if not found
         """
         try:
-            # Try GitHub API first
+            # Transient gateway errors are retried by the session; anything else means the
+            # commit can't be looked up
             api_url = f"https://api.github.com/repos/StackVista/stackstate-agent/commits/{sha}"
-            response = self.session.get(api_url)
-
-            if response.status_code == 200:
-                return response.json()
+            status, commit_info = self._cached_get(api_url, self._parse_commit)
 
-            # If API fails, try to fetch the commit page
-            commit_url = f"{self.AGENT_REPO}/commit/{sha}"
-            response = self.session.get(commit_url)
-
-            if response.status_code == 200:
-                # This is a fallback - we can't easily parse the HTML
-                # but we can confirm the commit exists
-                return {"sha": sha, "html_url": commit_url}
+            if status == 200:
+                return commit_info
 
         except Exception as e:
             print(f"Error fetching agent commit: {e}")
@@ -129,19 +282,19 @@ class IntegrationsFinder:
             # Try GitHub API to get the latest commit for this version
             api_url = "https://api.github.com/repos/StackVista/stackstate-agent-integrations/commits"
             params = {"sha": version, "per_page": 1}
-            response = self.session.get(api_url, params=params)
+            status, commits = self._cached_get(
+                api_url, lambda response: [self._slim_commit(commit) for commit in _json(response)[:1]], params=params
+            )
 
-            if response.status_code == 200:
-                commits = response.json()
-                if commits:
-                    return commits[0]
+            if status == 200 and commits:
+                return commits[0]
 
             # Fallback: try to get commit info for the version directly
             api_url = "https://api.github.com/repos/StackVista/stackstate-agent-integrations/commits/{}".format(version)
-            response = self.session.get(api_url)
+            status, commit_info = self._cached_get(api_url, self._parse_commit)
 
-            if response.status_code == 200:
-                return response.json()
+            if status == 200:
+                return commit_info
 
         except Exception as e:
             print(f"Error fetching integrations commit: {e}")
@@ -158,26 +311,52 @@ class IntegrationsFinder:
         Returns:
             True if it's a branch, False if it's a tag
         """
-        try:
-            # Check if it's a tag by trying to get tag info
-            api_url = "https://api.github.com/repos/StackVista/stackstate-agent-integrations/tags"
-            response = self.session.get(api_url)
-
-            if response.status_code == 200:
-                tags = response.json()
-                # Check if version matches any tag name
-                for tag in tags:
-                    if tag.get("name") == version:
-                        return False  # It's a tag
+        # Release tags are version numbers, so other names are branches without asking GitHub
+        if not _TAG_LIKE_RE.fullmatch(version):
+            return True
 
+        try:
             # If not found in tags, it's likely a branch
-            return True
+            return not self._is_tag(version)
 
         except Exception as e:
             print(f"Error checking if version is branch: {e}")
             # Default to assuming it's a branch if we can't determine
             return True
 
+    def _is_tag(self, version: str) -> Optional[bool]:
+        """
+        Check the integrations repository tags for a version.
+
+        Tag pages are fetched only until the version is found, and the pages seen so far are
+        reused for TAGS_CACHE_TTL seconds.
+
+        Args:
+            version: Integrations version string
+
+        Returns:
+            Whether the version is a tag, or None if the tags could not be fetched
+        """
+        if not self._tags_cache or time.monotonic() - self._tags_cache[0] >= self.TAGS_CACHE_TTL:
+            api_url = "https://api.github.com/repos/StackVista/stackstate-agent-integrations/tags"
+            self._tags_cache = (time.monotonic(), set(), (api_url, {"per_page": 100}))
+
+        fetched_at, tag_names, next_page = self._tags_cache
+        while version not in tag_names and next_page:
+            status, page = self._cached_get(
+                next_page[0],
+                lambda response: ([tag.get("name") for tag in _json(response)], response.links.get("next", {}).get("url")),
+                params=next_page[1],
+            )
+            if status != 200:
+                return None
+            page_names, next_url = page
+            tag_names.update(page_names)
+            next_page = (next_url, None) if next_url else None
+            self._tags_cache = (fetched_at, tag_names, next_page)
+
+        return version in tag_names
+
     def get_stackstate_deps(self, sha: str) -> Optional[str]:
         """
         Fetch stackstate-deps.json file content from the agent repository.
@@ -189,31 +368,29 @@ class IntegrationsFinder:
             Integrations version string or None if not found
         """
         try:
-            # Try GitHub API to get file content
-            api_url = "https://api.github.com/repos/StackVista/stackstate-agent/contents/stackstate-deps.json"
-            params = {"ref": sha}
-            response = self.session.get(api_url, params=params)
-
-            if response.status_code == 200:
-                content = response.json()
-                if content.get("type") == "file":
-                    # Decode base64 content
-                    import base64
-
-                    file_content = base64.b64decode(content["content"]).decode("utf-8")
-                    deps_data = json.loads(file_content)
-                    return deps_data.get("STACKSTATE_INTEGRATIONS_VERSION")
-
-            # Fallback: try raw GitHub URL
-            raw_url = "https://raw.githubusercontent.com/StackVista/stackstate-agent/{}/stackstate-deps.json".format(sha)
-            response = self.session.get(raw_url)
-
-            if response.status_code == 200:
-                deps_data = response.json()
-                return deps_data.get("STACKSTATE_INTEGRATIONS_VERSION")
-
+            return self._fetch_stackstate_deps(sha)
         except Exception as e:
             print(f"Error fetching stackstate-deps.json: {e}")
+            return None
+
+    def _fetch_stackstate_deps(self, sha: str) -> Optional[str]:
+        """Fetch the integrations version from stackstate-deps.json, raising on request errors."""
+        # Try the raw file first: served from a CDN and not counted against the API rate limit
+        raw_url = "https://raw.githubusercontent.com/StackVista/stackstate-agent/{}/stackstate-deps.json".format(sha)
+        status, integrations_version = self._cached_get(raw_url, self._parse_deps)
+
+        if status == 200:
+            return integrations_version
+
+        # Fallback: GitHub API, asking for the raw file instead of the base64 JSON envelope
+        api_url = "https://api.github.com/repos/StackVista/stackstate-agent/contents/stackstate-deps.json"
+        params = {"ref": sha}
+        status, integrations_version = self._cached_get(
+            api_url, self._parse_deps, params=params, headers={"Accept": "application/vnd.github.raw"}
+        )
+
+        if status == 200:
+            return integrations_version
 
         return None
 
@@ -229,7 +406,182 @@ class IntegrationsFinder:
         """
         return f"{self.INTEGRATIONS_REPO}/tree/{integrations_version}"
 
-    def find_integrations(self, input_string: str) -> Tuple[bool, str]:
+    def _graphql(self, query: str, variables: dict) -> Optional[dict]:
+        """
+        Run a GitHub GraphQL query; only available with a token.
+
+        Args:
+            query: GraphQL query
+            variables: Query variables
+
+        Returns:
+            The response data or None if the query failed
+        """
+        try:
+            response = self.session.post(
+                self.GRAPHQL_URL,
+                json={"query": query, "variables": variables},
+            )
+            if response.status_code != 200:
+                print(f"GitHub GraphQL API returned HTTP {response.status_code}, falling back to REST")
+                return None
+            payload = _json(response)
+            if payload.get("errors"):
+                messages = "; ".join(error.get("message", "unknown error") for error in payload["errors"])
+                print(f"GitHub GraphQL API query failed ({messages}), falling back to REST")
+                return None
+            return payload.get("data")
+        except Exception as e:
+            print(f"Error querying GitHub GraphQL API: {e}")
+            return None
+
+    @staticmethod
+    def _graphql_commit(node: Optional[dict]) -> Optional[dict]:
+        """Convert a GraphQL Commit (or a Tag pointing at one) to the shape of a REST commit."""
+        if node and node.get("target"):
+            node = node["target"]
+        if not node or not node.get("oid"):
+            return None
+        return {
+            "sha": node["oid"],
+            "html_url": node.get("url"),
+            "commit": {"author": node.get("author")},
+        }
+
+    def _lookup_agent(self, sha: str) -> Tuple[Optional[dict], Optional[str]]:
+        """
+        Fetch the agent commit and the integrations version it depends on.
+
+        With a GitHub token both come from one GraphQL query; otherwise (or if that fails)
+        the two REST lookups run concurrently.
+
+        Args:
+            sha: 8-character git SHA
+
+        Returns:
+            Tuple of (commit information dict or None, integrations version or None)
+        """
+        if self._token:
+            data = self._graphql(_AGENT_QUERY, {"sha": sha, "depsFile": f"{sha}:stackstate-deps.json"})
+            if data and data.get("repository"):
+                repository = data["repository"]
+                commit_info = self._graphql_commit(repository.get("commit"))
+                integrations_version = None
+                deps = repository.get("deps")
+                if deps and deps.get("text"):
+                    try:
+                        integrations_version = _json_loads(deps["text"]).get("STACKSTATE_INTEGRATIONS_VERSION")
+                    except ValueError:
+                        pass
+                return commit_info, integrations_version
+
+        # The lookups are network-bound and independent of each other, so run them concurrently
+        commit_future = self._executor.submit(self.get_agent_commit, sha)
+        deps_future = self._executor.submit(self._fetch_stackstate_deps, sha)
+        commit_info = commit_future.result()
+        if not commit_info:
+            # No need to wait for the deps file of a commit that wasn't found. A fetch that
+            # already started finishes in the background; it raises instead of printing, so its
+            # outcome is simply dropped with the future
+            deps_future.cancel()
+            return None, None
+        try:
+            return commit_info, deps_future.result()
+        except Exception as e:
+            print(f"Error fetching stackstate-deps.json: {e}")
+            return commit_info, None
+
+    def _lookup_integrations(self, version: str) -> Tuple[Optional[dict], bool]:
+        """
+        Fetch the integrations commit for a version and whether the version is a branch.
+
+        With a GitHub token both come from one GraphQL query; otherwise (or if that fails)
+        the two REST lookups run concurrently.
+
+        Args:
+            version: Integrations version (branch or tag)
+
+        Returns:
+            Tuple of (commit information dict or None, is_branch)
+        """
+        if self._token:
+            data = self._graphql(_INTEGRATIONS_QUERY, {"version": version, "tagRef": f"refs/tags/{version}"})
+            if data and data.get("repository"):
+                repository = data["repository"]
+                return self._graphql_commit(repository.get("commit")), repository.get("tag") is None
+
+        commit_future = self._executor.submit(self.get_integrations_commit, version)
+        is_branch_future = self._executor.submit(self.is_branch_version, version)
+        return commit_future.result(), is_branch_future.result()
+
+    def _cache_connect(self) -> Optional[sqlite3.Connection]:
+        """Open the on-disk result cache, or return None if caching is off or unavailable."""
+        if not self.use_cache:
+            return None
+        try:
+            # Resolved here rather than at import: Path.home() fails without HOME or a passwd entry
+            cache_dir = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "integrations-finder"
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(cache_dir / "cache.sqlite", timeout=1)
+            connection.execute(_CACHE_SCHEMA)
+            return connection
+        except (sqlite3.Error, OSError, RuntimeError, KeyError):
+            return None
+
+    def _cache_load(self, sha: str) -> Optional[Tuple[dict, str, Optional[dict], bool]]:
+        """
+        Look up a previously resolved SHA.
+
+        Args:
+            sha: 8-character git SHA
+
+        Returns:
+            Tuple of (agent commit, integrations version, integrations commit, is_branch) or None
+        """
+        connection = self._cache_connect()
+        if not connection:
+            return None
+        try:
+            with connection:
+                row = connection.execute(
+                    "SELECT agent_commit_json, integrations_version, integrations_commit_json, is_branch"
+                    " FROM sha_resolve WHERE sha = ?",
+                    (sha.lower(),),
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        finally:
+            connection.close()
+        if not row:
+            return None
+        return _json_loads(row[0]), row[1], _json_loads(row[2]), bool(row[3])
+
+    def _cache_store(
+        self, sha: str, commit_info: dict, integrations_version: str, integrations_commit_info: Optional[dict], is_branch: bool
+    ):
+        """Store a resolved SHA in the on-disk cache."""
+        connection = self._cache_connect()
+        if not connection:
+            return
+        try:
+            with connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO sha_resolve VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        sha.lower(),
+                        integrations_version,
+                        json.dumps(commit_info),
+                        json.dumps(integrations_commit_info),
+                        int(is_branch),
+                        time.time(),
+                    ),
+                )
+        except sqlite3.Error:
+            pass
+        finally:
+            connection.close()
+
+    def find_integrations(self, input_string: str) -> FinderResult:
         """
         Main method to find integrations source code from input.
 
@@ -237,38 +589,56 @@ class IntegrationsFinder:
             input_string: Input string containing SHA or container path
 
         Returns:
-            Tuple of (success: bool, message: str)
+            FinderResult describing the search outcome
         """
         # Extract SHA from input
         sha = self.extract_sha(input_string)
         if not sha:
-            return False, f"Could not extract 8-character SHA from: {input_string}"
+            return FinderResult(False, f"Could not extract 8-character SHA from: {input_string}")
 
         print(f"Extracted SHA: {sha}")
 
-        # Get agent commit
-        commit_info = self.get_agent_commit(sha)
+        cached = self._cache_load(sha)
+        if cached:
+            return self._format_result(sha, *cached)
+
+        # Get agent commit and the integrations version from stackstate-deps.json
+        commit_info, integrations_version = self._lookup_agent(sha)
         if not commit_info:
-            return False, f"Could not find agent commit with SHA: {sha}"
+            return FinderResult(False, f"Could not find agent commit with SHA: {sha}")
 
         print("Found SUSE Observability agent commit: {}".format(commit_info.get("html_url", "N/A")))
 
-        # Get integrations version from stackstate-deps.json
-        integrations_version = self.get_stackstate_deps(sha)
         if not integrations_version:
-            return (
-                False,
-                f"Could not find integrations version in stackstate-deps.json for SHA: {sha}",
-            )
+            return FinderResult(False, f"Could not find integrations version in stackstate-deps.json for SHA: {sha}")
 
         print("Found integrations version: {}".format(integrations_version))
 
-        # Get integrations commit information
-        integrations_commit_info = self.get_integrations_commit(integrations_version)
+        # Get integrations commit information and check if this is a branch version (development/unreleased)
+        integrations_commit_info, is_branch = self._lookup_integrations(integrations_version)
+
+        # A branch keeps moving and may still be tagged later, so only released tags are cached
+        if integrations_commit_info and not is_branch:
+            self._cache_store(sha, commit_info, integrations_version, integrations_commit_info, is_branch)
+
+        return self._format_result(sha, commit_info, integrations_version, integrations_commit_info, is_branch)
+
+    def _format_result(
+        self, sha: str, commit_info: dict, integrations_version: str, integrations_commit_info: Optional[dict], is_branch: bool
+    ) -> FinderResult:
+        """
+        Build the success result of a search.
 
-        # Check if this is a branch version (development/unreleased)
-        is_branch = self.is_branch_version(integrations_version)
+        Args:
+            sha: 8-character git SHA
+            commit_info: Agent commit information
+            integrations_version: Integrations version (branch or tag)
+            integrations_commit_info: Integrations commit information, if found
+            is_branch: Whether the integrations version is a branch
 
+        Returns:
+            Successful FinderResult
+        """
         # Build integrations URL
         integrations_url = self.build_integrations_url(integrations_version)
 
@@ -318,235 +688,11 @@ Integrations Commit:
 
 Click the integrations URL above to view the source code."""
 
-        return True, success_message, is_branch
-
-
-if PYQT6_AVAILABLE:
-
-    class WorkerThread(QThread):
-        """Worker thread for GUI to prevent blocking."""
-
-        finished = pyqtSignal(bool, str)
-
-        def __init__(self, finder: IntegrationsFinder, input_string: str):
-            super().__init__()
-            self.finder = finder
-            self.input_string = input_string
-
-        def run(self):
-            result = self.finder.find_integrations(self.input_string)
-            if len(result) == 3:
-                success, message, is_branch = result
-            else:
-                # Backward compatibility
-                success, message = result
-                is_branch = False
-
-            # Add branch indicator to message for GUI detection
-            if is_branch:
-                message += "\n[BRANCH_VERSION_DETECTED]"
-
-            self.finished.emit(success, message)
-
-else:
-    # Dummy class for when PyQt6 is not available
-    class WorkerThread:
-        def __init__(self, finder: IntegrationsFinder, input_string: str):
-            self.finder = finder
-            self.input_string = input_string
-
-
-if PYQT6_AVAILABLE:
-
-    class IntegrationsFinderGUI(QMainWindow):
-        """GUI for the Agent Integrations Finder tool."""
-
-        def __init__(self):
-            super().__init__()
-            self.finder = IntegrationsFinder()
-            self.init_ui()
-
-else:
-    # Dummy class for when PyQt6 is not available
-    class IntegrationsFinderGUI:
-        def __init__(self):
-            pass
-
-    def init_ui(self):
-        """Initialize the user interface."""
-        self.setWindowTitle("Agent Integrations Finder")
-        self.setGeometry(600, 400, 800, 500)
+        return FinderResult(True, success_message, is_branch, integrations_url)
 
-        # Central widget
-        central_widget = QWidget()
-        self.setCentralWidget(central_widget)
 
-        # Main layout
-        layout = QVBoxLayout(central_widget)
-        layout.setSpacing(20)
-        layout.setContentsMargins(20, 20, 20, 20)
-
-        # Header with title and logo
-        header_layout = QHBoxLayout()
-
-        # Title (left side)
-        title = QLabel("Agent Integrations Finder")
-        title.setFont(QFont("Arial", 16, QFont.Weight.Bold))
-        title.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-        header_layout.addWidget(title)
-
-        # Add stretch to push logo to the right
-        header_layout.addStretch()
-
-        # Logo (right side)
-        try:
-            logo_label = QLabel()
-            logo_pixmap = QPixmap("assets/images/logo.png")
-            if not logo_pixmap.isNull():
-                # Scale the logo to a reasonable size (e.g., 100px height)
-                scaled_pixmap = logo_pixmap.scaledToHeight(60, Qt.TransformationMode.SmoothTransformation)
-                logo_label.setPixmap(scaled_pixmap)
-                logo_label.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-            else:
-                logo_label.setText("")  # Empty if image fails to load
-        except Exception:
-            logo_label.setText("")  # Empty if image fails to load
-
-        header_layout.addWidget(logo_label)
-        layout.addLayout(header_layout)
-
-        # Description
-        desc = QLabel(
-            "Enter a SUSE Observability agent container tag or SHA to find the corresponding integrations source code"
-        )
-        desc.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        desc.setWordWrap(True)
-        layout.addWidget(desc)
-
-        # Warning label for development versions (initially hidden)
-        self.warning_label = QLabel(
-            "⚠️ WARNING: You are working with an unofficial/unreleased development version of the integrations"
-        )
-        self.warning_label.setStyleSheet(
-            "color: red; font-weight: bold; background-color: #ffe6e6; "
-            "padding: 8px; border: 2px solid red; border-radius: 4px;"
-        )
-        self.warning_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.warning_label.setWordWrap(True)
-        self.warning_label.setVisible(False)
-        layout.addWidget(self.warning_label)
-
-        # Input section
-        input_layout = QHBoxLayout()
-        input_label = QLabel("SUSE Observability Agent SHA or Container Path:")
-        self.input_field = QLineEdit()
-        self.input_field.setPlaceholderText("e.g., a1b2c3d4 or quay.io/stackstate/stackstate-k8s-agent:a1b2c3d4")
-        input_layout.addWidget(input_label)
-        input_layout.addWidget(self.input_field)
-        layout.addLayout(input_layout)
-
-        # Progress bar
-        self.progress_bar = QProgressBar()
-        self.progress_bar.setVisible(False)
-        layout.addWidget(self.progress_bar)
-
-        # Buttons
-        button_layout = QHBoxLayout()
-        self.find_button = QPushButton("Find Integrations")
-        self.find_button.clicked.connect(self.find_integrations)
-        self.open_url_button = QPushButton("Open URL in Browser")
-        self.open_url_button.clicked.connect(self.open_url)
-        self.open_url_button.setEnabled(False)
-        button_layout.addWidget(self.find_button)
-        button_layout.addWidget(self.open_url_button)
-        layout.addLayout(button_layout)
-
-        # Results
-        self.results_text = QTextEdit()
-        self.results_text.setReadOnly(True)
-        self.results_text.setPlaceholderText("Results will appear here...")
-        layout.addWidget(self.results_text)
-
-        # Store URL for opening in browser
-        self.current_url = None
-
-    def find_integrations(self):
-        """Find integrations source code."""
-        input_string = self.input_field.text().strip()
-        if not input_string:
-            QMessageBox.warning(
-                self,
-                "Input Required",
-                "Please enter a SUSE Observability agent SHA or container path.",
-            )
-            return
-
-        # Disable UI during search
-        self.find_button.setEnabled(False)
-        self.progress_bar.setVisible(True)
-        self.progress_bar.setRange(0, 0)  # Indeterminate progress
-        self.results_text.clear()
-
-        # Start worker thread
-        self.worker = WorkerThread(self.finder, input_string)
-        self.worker.finished.connect(self.on_search_finished)
-        self.worker.start()
-
-    def on_search_finished(self, success: bool, message: str):
-        """Handle search completion."""
-        # Re-enable UI
-        self.find_button.setEnabled(True)
-        self.progress_bar.setVisible(False)
-
-        # Check if this is a branch version and show/hide warning
-        is_branch = "DEVELOPMENT BRANCH" in message or "[BRANCH_VERSION_DETECTED]" in message
-        self.warning_label.setVisible(is_branch)
-
-        # Reset button styling
-        self.open_url_button.setStyleSheet("")
-
-        # Display results
-        self.results_text.setPlainText(message)
-
-        # Extract URL if successful
-        self.current_url = None
-        if success:
-            # Extract URL from message - look for the integrations URL
-            url_match = re.search(r"URL: (https://[^\s]+)", message)
-            if url_match:
-                # Find the integrations URL specifically
-                lines = message.split("\n")
-                for line in lines:
-                    if "Integrations Commit:" in line or "URL:" in line:
-                        url_match = re.search(r"URL: (https://[^\s]+)", line)
-                        if url_match and "stackstate-agent-integrations" in url_match.group(1):
-                            self.current_url = url_match.group(1)
-                            self.open_url_button.setEnabled(True)
-
-                            # Add red border if it's a branch version
-                            if is_branch:
-                                self.open_url_button.setStyleSheet(
-                                    """
-                                    QPushButton {
-                                        border: 3px solid red;
-                                        border-radius: 5px;
-                                        background-color: #ffe6e6;
-                                        color: red;
-                                        font-weight: bold;
-                                    }
-                                    QPushButton:hover {
-                                        background-color: #ffcccc;
-                                    }
-                                """
-                                )
-                            break
-
-    def open_url(self):
-        """Open the integrations URL in the default browser."""
-        if self.current_url:
-            QDesktopServices.openUrl(QUrl(self.current_url))
-        else:
-            QMessageBox.warning(self, "No URL", "No URL available to open.")
+# Shared finder so repeated lookups in one process reuse its connections and caches
+_DEFAULT_FINDER = IntegrationsFinder()
 
 
 @click.group()
@@ -557,58 +703,47 @@ def cli():
 
 @cli.command()
 @click.argument("input_string")
-def find(input_string):
+@click.option("--no-cache", is_flag=True, help="Always query GitHub instead of the on-disk result cache.")
+def find(input_string, no_cache):
     """Find integrations source code from SUSE Observability agent SHA or container path."""
-    finder = IntegrationsFinder()
+    finder = IntegrationsFinder(use_cache=False) if no_cache else _DEFAULT_FINDER
     result = finder.find_integrations(input_string)
 
-    if len(result) == 3:
-        success, message, is_branch = result
-    else:
-        # Backward compatibility
-        success, message = result
-        is_branch = False
-
-    if success:
-        # Extract URL for easy copying
-        url_match = re.search(r"URL: (https://[^\s]+)", message)
-        if url_match:
-            # Find the integrations URL specifically
-            lines = message.split("\n")
-            for line in lines:
-                if "Integrations Commit:" in line and "URL:" in line:
-                    url_match = re.search(r"URL: (https://[^\s]+)", line)
-                    if url_match and "stackstate-agent-integrations" in url_match.group(1):
-                        url = url_match.group(1)
-                        print(f"\nQuick access URL: {url}")
-
-                        # Add warning if it's a branch version
-                        if is_branch:
-                            print("\n⚠️  WARNING: This integrations version appears to be a development branch!")
-                            print("   You are working with an unofficial/unreleased development version.")
-
-                        # Ask if user wants to open in browser
-                        try:
-                            open_browser = input("\nOpen URL in browser? (y/N): ").strip().lower()
-                            if open_browser in ["y", "yes"]:
-                                webbrowser.open(url)
-                        except KeyboardInterrupt:
-                            pass
-                        break
-
-    print(f"\n{message}")
+    print(f"\n{result.message}")
+
+    if result.success and result.integrations_url:
+        print(f"\nQuick access URL: {result.integrations_url}")
+
+        # Add warning if it's a branch version
+        if result.is_branch:
+            print("\n⚠️  WARNING: This integrations version appears to be a development branch!")
+            print("   You are working with an unofficial/unreleased development version.")
+
+        # Ask if user wants to open in browser, unless run from a script or CI
+        if sys.stdin.isatty():
+            try:
+                open_browser = input("\nOpen URL in browser? (y/N): ").strip().lower()
+                if open_browser in ["y", "yes"]:
+                    webbrowser.open(result.integrations_url)
+            except (EOFError, KeyboardInterrupt):
+                pass
 
 
 @cli.command()
 def gui():
     """Launch the graphical user interface."""
-    if not PYQT6_AVAILABLE:
+    # PyQt6 is only loaded here so the CLI starts without it
+    try:
+        from PyQt6.QtWidgets import QApplication
+
+        from integrations_finder_gui import IntegrationsFinderGUI
+    except ImportError:
         click.echo("Error: PyQt6 is not available. GUI mode requires PyQt6 to be installed.")
         click.echo("Please install PyQt6 with: pip install PyQt6")
         sys.exit(1)
 
     app = QApplication(sys.argv)
-    window = IntegrationsFinderGUI()
+    window = IntegrationsFinderGUI(_DEFAULT_FINDER)
     window.show()
     sys.exit(app.exec())
 
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+SUSE Observability Integrations Finder GUI
+
+PyQt6 interface of the integrations finder, loaded by the gui command.
+"""
+
+from typing import TYPE_CHECKING
+
+from PyQt6.QtCore import QObject, QRunnable, Qt, QThreadPool, QUrl, pyqtSignal
+from PyQt6.QtGui import QDesktopServices, QFont, QPixmap
+from PyQt6.QtWidgets import (
+    QHBoxLayout,
+    QLabel,
+    QLineEdit,
+    QMainWindow,
+    QMessageBox,
+    QProgressBar,
+    QPushButton,
+    QTextEdit,
+    QVBoxLayout,
+    QWidget,
+)
+
+if TYPE_CHECKING:
+    from integrations_finder import FinderResult, IntegrationsFinder
+
+
+class FindRunnable(QRunnable):
+    """Search run on the shared thread pool so the GUI doesn't block."""
+
+    class Signals(QObject):
+        finished = pyqtSignal(object)
+
+    def __init__(self, finder: "IntegrationsFinder", input_string: str):
+        super().__init__()
+        self.finder = finder
+        self.input_string = input_string
+        self.signals = self.Signals()
+
+    def run(self):
+        self.signals.finished.emit(self.finder.find_integrations(self.input_string))
+
+
+class IntegrationsFinderGUI(QMainWindow):
+    """GUI for the Agent Integrations Finder tool."""
+
+    def __init__(self, finder: "IntegrationsFinder"):
+        super().__init__()
+        self.finder = finder
+        self.init_ui()
+
+    def init_ui(self):
+        """Initialize the user interface."""
+        self.setWindowTitle("Agent Integrations Finder")
+        self.setGeometry(600, 400, 800, 500)
+
+        # Central widget
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+
+        # Main layout
+        layout = QVBoxLayout(central_widget)
+        layout.setSpacing(20)
+        layout.setContentsMargins(20, 20, 20, 20)
+
+        # Header with title and logo
+        header_layout = QHBoxLayout()
+
+        # Title (left side)
+        title = QLabel("Agent Integrations Finder")
+        title.setFont(QFont("Arial", 16, QFont.Weight.Bold))
+        title.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+        header_layout.addWidget(title)
+
+        # Add stretch to push logo to the right
+        header_layout.addStretch()
+
+        # Logo (right side)
+        try:
+            logo_label = QLabel()
+            # Pre-scaled to 60px so startup doesn't decode and resample the full-size logo
+            logo_pixmap = QPixmap("assets/images/logo@60.png")
+            if not logo_pixmap.isNull():
+                logo_label.setPixmap(logo_pixmap)
+                logo_label.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+            else:
+                logo_label.setText("")  # Empty if image fails to load
+        except Exception:
+            logo_label.setText("")  # Empty if image fails to load
+
+        header_layout.addWidget(logo_label)
+        layout.addLayout(header_layout)
+
+        # Description
+        desc = QLabel(
+            "Enter a SUSE Observability agent container tag or SHA to find the corresponding integrations source code"
+        )
+        desc.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        desc.setWordWrap(True)
+        layout.addWidget(desc)
+
+        # Warning label for development versions (initially hidden)
+        self.warning_label = QLabel(
+            "⚠️ WARNING: You are working with an unofficial/unreleased development version of the integrations"
+        )
+        self.warning_label.setStyleSheet(
+            "color: red; font-weight: bold; background-color: #ffe6e6; "
+            "padding: 8px; border: 2px solid red; border-radius: 4px;"
+        )
+        self.warning_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.warning_label.setWordWrap(True)
+        self.warning_label.setVisible(False)
+        layout.addWidget(self.warning_label)
+
+        # Input section
+        input_layout = QHBoxLayout()
+        input_label = QLabel("SUSE Observability Agent SHA or Container Path:")
+        self.input_field = QLineEdit()
+        self.input_field.setPlaceholderText("e.g., a1b2c3d4 or quay.io/stackstate/stackstate-k8s-agent:a1b2c3d4")
+        input_layout.addWidget(input_label)
+        input_layout.addWidget(self.input_field)
+        layout.addLayout(input_layout)
+
+        # Progress bar
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setVisible(False)
+        layout.addWidget(self.progress_bar)
+
+        # Buttons
+        button_layout = QHBoxLayout()
+        self.find_button = QPushButton("Find Integrations")
+        self.find_button.clicked.connect(self.find_integrations)
+        self.open_url_button = QPushButton("Open URL in Browser")
+        self.open_url_button.clicked.connect(self.open_url)
+        self.open_url_button.setEnabled(False)
+        button_layout.addWidget(self.find_button)
+        button_layout.addWidget(self.open_url_button)
+        layout.addLayout(button_layout)
+
+        # Results
+        self.results_text = QTextEdit()
+        self.results_text.setReadOnly(True)
+        self.results_text.setPlaceholderText("Results will appear here...")
+        layout.addWidget(self.results_text)
+
+        # Store URL for opening in browser
+        self.current_url = None
+
+    def find_integrations(self):
+        """Find integrations source code."""
+        input_string = self.input_field.text().strip()
+        if not input_string:
+            QMessageBox.warning(
+                self,
+                "Input Required",
+                "Please enter a SUSE Observability agent SHA or container path.",
+            )
+            return
+
+        # Disable UI during search
+        self.find_button.setEnabled(False)
+        self.progress_bar.setVisible(True)
+        self.progress_bar.setRange(0, 0)  # Indeterminate progress
+        self.results_text.clear()
+
+        # Run the search on a pooled thread; pool threads are reused across searches
+        self.runnable = FindRunnable(self.finder, input_string)
+        self.runnable.signals.finished.connect(self.on_search_finished)
+        QThreadPool.globalInstance().start(self.runnable)
+
+    def on_search_finished(self, result: "FinderResult"):
+        """Handle search completion."""
+        # Re-enable UI
+        self.find_button.setEnabled(True)
+        self.progress_bar.setVisible(False)
+
+        # Show/hide the branch version warning
+        self.warning_label.setVisible(result.is_branch)
+
+        # Reset button styling
+        self.open_url_button.setStyleSheet("")
+
+        # Display results
+        self.results_text.setPlainText(result.message)
+
+        self.current_url = None
+        if result.success and result.integrations_url:
+            self.current_url = result.integrations_url
+            self.open_url_button.setEnabled(True)
+
+            # Add red border if it's a branch version
+            if result.is_branch:
+                self.open_url_button.setStyleSheet(
+                    """
+                    QPushButton {
+                        border: 3px solid red;
+                        border-radius: 5px;
+                        background-color: #ffe6e6;
+                        color: red;
+                        font-weight: bold;
+                    }
+                    QPushButton:hover {
+                        background-color: #ffcccc;
+                    }
+                """
+                )
+
+    def open_url(self):
+        """Open the integrations URL in the default browser."""
+        if self.current_url:
+            QDesktopServices.openUrl(QUrl(self.current_url))
+        else:
+            QMessageBox.warning(self, "No URL", "No URL available to open.")
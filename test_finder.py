@@ -3,8 +3,18 @@
 Test script for the Integrations Finder tool.
 """
 
+import json
+import os
+import tempfile
+
+import requests
+
 from integrations_finder import IntegrationsFinder
 
+# Shared by the network tests; the on-disk result cache is off so every run exercises the
+# lookups instead of a previous run's answer
+_NETWORK_FINDER = IntegrationsFinder(use_cache=False)
+
 
 def test_sha_extraction():
     """Test SHA extraction from various input formats."""
@@ -29,7 +39,7 @@ def test_sha_extraction():
 
 def test_integrations_finder():
     """Test the complete integrations finder workflow."""
-    finder = IntegrationsFinder()
+    finder = _NETWORK_FINDER
 
     # Test with a sample input (this will fail if the SHA doesn't exist)
     test_input = "a1b2c3d4"  # This is a dummy SHA for testing
@@ -37,20 +47,15 @@ def test_integrations_finder():
     print(f"\nTesting complete workflow with: {test_input}")
     result = finder.find_integrations(test_input)
 
-    if len(result) == 3:
-        success, message, is_branch = result
-        print(f"Success: {success}")
-        print(f"Is Branch: {is_branch}")
-        print(f"Message: {message}")
-    else:
-        success, message = result
-        print(f"Success: {success}")
-        print(f"Message: {message}")
+    print(f"Success: {result.success}")
+    print(f"Is Branch: {result.is_branch}")
+    print(f"Integrations URL: {result.integrations_url}")
+    print(f"Message: {result.message}")
 
 
 def test_branch_detection():
     """Test branch detection functionality."""
-    finder = IntegrationsFinder()
+    finder = _NETWORK_FINDER
 
     # Test known tags
     known_tags = ["7.51.1-3", "7.51.1", "v1.0.0"]
@@ -69,7 +74,220 @@ def test_branch_detection():
         print(f"  {branch}: {status}")
 
 
+def _stub_response(status_code, body=None, link=None):
+    """Build a GitHub response without going over the network."""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.dumps(body).encode() if body is not None else b""
+    if link:
+        response.headers["Link"] = link
+    return response
+
+
+def _stub_tag_pages(finder, pages):
+    """Serve tag names in pages linked by rel="next"; returns the list of requested URLs."""
+    requested = []
+    base_url = "https://api.github.com/repos/StackVista/stackstate-agent-integrations/tags"
+
+    def get(url, params=None, headers=None, **kwargs):
+        requested.append(url)
+        page = int(url.rsplit("page=", 1)[1]) if "page=" in url else 1
+        link = f'<{base_url}?per_page=100&page={page + 1}>; rel="next"' if page < len(pages) else None
+        return _stub_response(200, [{"name": name} for name in pages[page - 1]], link)
+
+    finder.session.get = get
+    return requested
+
+
+def test_tag_on_later_page():
+    """A tag past the first page of /tags is found by following the Link header."""
+    finder = IntegrationsFinder(use_cache=False)
+    requested = _stub_tag_pages(finder, [["7.51.1-1", "7.51.1-2"], ["7.51.1-3"]])
+
+    assert finder.is_branch_version("7.51.1-3") is False
+    assert len(requested) == 2
+    # Already seen on the first page: no further requests
+    assert finder.is_branch_version("7.51.1-1") is False
+    assert len(requested) == 2
+
+
+def test_tags_resume_after_exhaustion():
+    """Once every tag page was read, misses are answered locally until the TTL expires."""
+    finder = IntegrationsFinder(use_cache=False)
+    requested = _stub_tag_pages(finder, [["7.51.1-1"], ["7.51.1-2"]])
+
+    assert finder.is_branch_version("9.9.9") is True
+    assert len(requested) == 2
+    assert finder.is_branch_version("9.9.8") is True
+    assert len(requested) == 2
+
+    finder.TAGS_CACHE_TTL = 0
+    assert finder.is_branch_version("7.51.1-2") is False
+    assert len(requested) == 4
+
+
+def test_result_cache_round_trip():
+    """A resolved SHA is answered from the on-disk cache without any GitHub request."""
+    previous = os.environ.get("XDG_CACHE_HOME")
+    with tempfile.TemporaryDirectory() as cache_home:
+        os.environ["XDG_CACHE_HOME"] = cache_home
+        try:
+            agent_commit = {
+                "sha": "a1b2c3d4ffff",
+                "html_url": "https://github.com/StackVista/stackstate-agent/commit/a1b2c3d4ffff",
+                "commit": {"author": {"name": "Dev", "date": "2024-01-01T00:00:00Z"}},
+            }
+            integrations_commit = {"sha": "eeeeffff", "html_url": None, "commit": {"author": None}}
+            IntegrationsFinder()._cache_store("a1b2c3d4", agent_commit, "7.51.1-3", integrations_commit, False)
+
+            finder = IntegrationsFinder()
+
+            def get(*args, **kwargs):
+                raise AssertionError("cached SHA must not query GitHub")
+
+            finder.session.get = get
+            assert finder._cache_load("A1B2C3D4") == (agent_commit, "7.51.1-3", integrations_commit, False)
+            result = finder.find_integrations("a1b2c3d4")
+            assert result.success
+            assert result.is_branch is False
+            assert result.integrations_url == "https://github.com/StackVista/stackstate-agent-integrations/tree/7.51.1-3"
+        finally:
+            if previous is None:
+                os.environ.pop("XDG_CACHE_HOME", None)
+            else:
+                os.environ["XDG_CACHE_HOME"] = previous
+
+
+def test_sha_precedence():
+    """A container tag SHA wins over a quay.io SHA wherever each appears in the input."""
+    finder = IntegrationsFinder(use_cache=False)
+    quay = "quay.io/stackstate/stackstate-k8s-agent:deadbeef"
+    tagged = "stackstate/agent:7.51.1-a1b2c3d4"
+
+    assert finder.extract_sha(f"{quay} {tagged}") == "a1b2c3d4"
+    assert finder.extract_sha(f"{tagged} {quay}") == "a1b2c3d4"
+    assert finder.extract_sha(quay) == "deadbeef"
+
+
+def _stub_graphql_finder(graphql_payload):
+    """Finder with a token whose GraphQL POSTs return graphql_payload; records REST GETs."""
+    finder = IntegrationsFinder(use_cache=False)
+    finder._token = "test-token"
+    rest_requests = []
+
+    def post(url, json=None, **kwargs):
+        return _stub_response(200, graphql_payload(json["variables"]))
+
+    def get(url, params=None, headers=None, **kwargs):
+        rest_requests.append(url)
+        return _stub_response(404, {"message": "Not Found"})
+
+    finder.session.post = post
+    finder.session.get = get
+    return finder, rest_requests
+
+
+def test_graphql_lookup():
+    """With a token, commits, the deps file and the tag check all come from GraphQL."""
+
+    def graphql_payload(variables):
+        if "sha" in variables:
+            return {
+                "data": {
+                    "repository": {
+                        "commit": {
+                            "oid": "a1b2c3d4ffff",
+                            "url": "https://github.com/StackVista/stackstate-agent/commit/a1b2c3d4ffff",
+                            "author": {"name": "Dev", "date": "2024-01-01T00:00:00Z"},
+                        },
+                        "deps": {"text": '{"STACKSTATE_INTEGRATIONS_VERSION": "7.51.1-3"}'},
+                    }
+                }
+            }
+        commit = {"oid": "eeeeffff0000", "url": None, "author": {"name": "Int", "date": "2024-02-01T00:00:00Z"}}
+        return {"data": {"repository": {"tag": {"name": variables["version"]}, "commit": {"target": commit}}}}
+
+    finder, rest_requests = _stub_graphql_finder(graphql_payload)
+    result = finder.find_integrations("a1b2c3d4")
+
+    assert result.success
+    assert result.is_branch is False
+    assert result.integrations_url == "https://github.com/StackVista/stackstate-agent-integrations/tree/7.51.1-3"
+    assert "SHA: eeeeffff" in result.message
+    assert rest_requests == []
+
+
+def test_graphql_errors_fall_back_to_rest():
+    """A GraphQL errors payload makes the search use the REST API instead."""
+    finder, rest_requests = _stub_graphql_finder(lambda variables: {"errors": [{"message": "Bad credentials"}]})
+    result = finder.find_integrations("a1b2c3d4")
+
+    assert not result.success
+    assert result.message == "Could not find agent commit with SHA: a1b2c3d4"
+    assert "https://api.github.com/repos/StackVista/stackstate-agent/commits/a1b2c3d4" in rest_requests
+
+
+def _stub_etag_server(finder):
+    """Serve {"url": url} with a per-URL ETag, answering a matching If-None-Match with 304."""
+    sent_etags = []
+
+    def get(url, params=None, headers=None, **kwargs):
+        etag = f'"{url}"'
+        sent_etags.append((headers or {}).get("If-None-Match"))
+        if (headers or {}).get("If-None-Match") == etag:
+            return _stub_response(304)
+        response = _stub_response(200, {"url": url})
+        response.headers["ETag"] = etag
+        return response
+
+    finder.session.get = get
+    return sent_etags
+
+
+def test_etag_revalidation():
+    """A repeated request is revalidated with its ETag and a 304 reuses the parsed value."""
+    finder = IntegrationsFinder(use_cache=False)
+    sent_etags = _stub_etag_server(finder)
+    parsed = []
+
+    def parse(response):
+        parsed.append(response)
+        return response.json()["url"]
+
+    assert finder._cached_get("https://api.github.com/a", parse) == (200, "https://api.github.com/a")
+    assert finder._cached_get("https://api.github.com/a", parse) == (200, "https://api.github.com/a")
+    assert sent_etags == [None, '"https://api.github.com/a"']
+    assert len(parsed) == 1
+
+
+def test_etag_cache_evicts_least_recently_used():
+    """The ETag cache keeps only the ETAG_CACHE_SIZE most recently used URLs."""
+    finder = IntegrationsFinder(use_cache=False)
+    _stub_etag_server(finder)
+    urls = [f"https://api.github.com/{i}" for i in range(finder.ETAG_CACHE_SIZE + 1)]
+
+    finder._cached_get(urls[0], lambda response: None)
+    finder._cached_get(urls[1], lambda response: None)
+    # Revalidating the first URL makes the second one the least recently used
+    finder._cached_get(urls[0], lambda response: None)
+    for url in urls[2:]:
+        finder._cached_get(url, lambda response: None)
+
+    assert len(finder._etag_cache) == finder.ETAG_CACHE_SIZE
+    assert urls[0] + "?" in finder._etag_cache
+    assert urls[1] + "?" not in finder._etag_cache
+    assert urls[-1] + "?" in finder._etag_cache
+
+
 if __name__ == "__main__":
     test_sha_extraction()
     test_integrations_finder()
     test_branch_detection()
+    test_tag_on_later_page()
+    test_tags_resume_after_exhaustion()
+    test_result_cache_round_trip()
+    test_sha_precedence()
+    test_graphql_lookup()
+    test_graphql_errors_fall_back_to_rest()
+    test_etag_revalidation()
+    test_etag_cache_evicts_least_recently_used()